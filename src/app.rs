@@ -13,6 +13,10 @@ use crossterm::{
 };
 use ratatui::{backend::CrosstermBackend, Terminal};
 use std::io;
+use std::ops::Range;
+use std::sync::mpsc::{self, Receiver, Sender, TryRecvError};
+use std::thread;
+use std::time::Duration;
 
 #[derive(Debug, Clone, PartialEq)]
 pub enum Screen {
@@ -27,8 +31,18 @@ pub struct App {
     pub projects: Vec<ProjectInfo>,
     pub displayed_projects: Vec<ProjectInfo>,
     pub sessions: Vec<SessionInfo>,
+    pub session_cache: parser::SessionListCache,
     pub filtered_sessions: Vec<SessionInfo>,
     pub messages: Vec<Message>,
+    /// First rendered row of each laid-out message in the detail view, plus
+    /// the running total as the last element. Lets the UI jump straight to the
+    /// messages under the viewport instead of laying out the whole session.
+    /// Rows are counted after wrapping at `message_wrap_width`. Filled in
+    /// chunks; see `layout_step`.
+    pub message_line_starts: Vec<usize>,
+    /// Header timestamps of the messages in view, formatted before each draw
+    /// and reused while they stay in view; see `cache_visible_timestamps`.
+    pub visible_timestamps: ui::TimestampWindow,
     pub selected_project: usize,
     pub selected_session: usize,
     pub scroll_offset: usize,
@@ -36,6 +50,7 @@ pub struct App {
     pub current_project_name: String,
     pub should_quit: bool,
     pub terminal_height: usize,
+    pub terminal_width: usize,
     pub search_active: bool,
     pub search_query: String,
     pub global_search_results: Vec<SearchResult>,
@@ -45,8 +60,32 @@ pub struct App {
     pub project_scroll_offset: usize,
     pub session_scroll_offset: usize,
     pub global_search_scroll_offset: usize,
+    /// Result of a session list or session load still running on a
+    /// background thread; see `spawn_load`.
+    loading: Option<Receiver<Loaded>>,
 }
 
+/// Data read on a background thread for the screen that requested it.
+enum Loaded {
+    Sessions {
+        project_name: String,
+        stamp: Option<parser::ProjectStamp>,
+        sessions: Vec<SessionInfo>,
+    },
+    /// The next messages of the session being opened, in order.
+    Messages(Vec<Message>),
+}
+
+/// Messages laid out per step, so a long session shows its first page
+/// before the rest has been measured.
+const LAYOUT_CHUNK: usize = 200;
+
+/// Messages sent per batch while a session streams in.
+const MESSAGE_BATCH: usize = 200;
+
+/// How long to wait for a key before checking on a background load again.
+const LOADING_POLL: Duration = Duration::from_millis(50);
+
 fn ensure_visible(selected: usize, scroll_offset: &mut usize, visible_height: usize) {
     if visible_height == 0 {
         return;
@@ -67,8 +106,11 @@ impl App {
             projects,
             displayed_projects,
             sessions: Vec::new(),
+            session_cache: parser::SessionListCache::default(),
             filtered_sessions: Vec::new(),
             messages: Vec::new(),
+            message_line_starts: vec![0],
+            visible_timestamps: ui::TimestampWindow::default(),
             selected_project: 0,
             selected_session: 0,
             scroll_offset: 0,
@@ -76,6 +118,7 @@ impl App {
             current_project_name: String::new(),
             should_quit: false,
             terminal_height: 24,
+            terminal_width: 80,
             search_active: false,
             search_query: String::new(),
             global_search_results: Vec::new(),
@@ -85,6 +128,7 @@ impl App {
             project_scroll_offset: 0,
             session_scroll_offset: 0,
             global_search_scroll_offset: 0,
+            loading: None,
         }
     }
 
@@ -96,8 +140,11 @@ impl App {
             projects,
             displayed_projects,
             sessions: Vec::new(),
+            session_cache: parser::SessionListCache::default(),
             filtered_sessions: Vec::new(),
             messages: Vec::new(),
+            message_line_starts: vec![0],
+            visible_timestamps: ui::TimestampWindow::default(),
             selected_project: 0,
             selected_session: 0,
             scroll_offset: 0,
@@ -105,6 +152,7 @@ impl App {
             current_project_name: String::new(),
             should_quit: false,
             terminal_height: 24,
+            terminal_width: 80,
             search_active: false,
             search_query: String::new(),
             global_search_results: Vec::new(),
@@ -114,6 +162,7 @@ impl App {
             project_scroll_offset: 0,
             session_scroll_offset: 0,
             global_search_scroll_offset: 0,
+            loading: None,
         }
     }
 
@@ -184,30 +233,136 @@ impl App {
         if self.displayed_projects.is_empty() {
             return;
         }
-        let project = &self.displayed_projects[self.selected_project];
-        self.current_project_name = project.dir_name.clone();
+        let project_name = self.displayed_projects[self.selected_project].dir_name.clone();
+        self.current_project_name = project_name.clone();
         self.search_query.clear();
-        self.sessions = parser::list_sessions(&project.dir_name).unwrap_or_default();
-        self.apply_filter();
-        self.selected_session = 0;
-        self.session_scroll_offset = 0;
-        self.scroll_offset = 0;
-        self.screen = Screen::SessionList;
+
+        let stamp = parser::project_stamp(&project_name);
+        self.show_session_list(project_name, stamp, |project_name| {
+            parser::list_sessions(project_name).unwrap_or_default()
+        });
+    }
+
+    /// Show the sessions of a project whose files are at `stamp`. An
+    /// unchanged project is shown straight from the cache; otherwise the list
+    /// opens empty and fills in when `read` finishes on a background thread.
+    fn show_session_list(
+        &mut self,
+        project_name: String,
+        stamp: Option<parser::ProjectStamp>,
+        read: impl FnOnce(&str) -> Vec<SessionInfo> + Send + 'static,
+    ) {
+        if let Some(sessions) = stamp
+            .as_ref()
+            .and_then(|stamp| self.session_cache.get(&project_name, stamp))
+        {
+            self.set_sessions(sessions);
+            return;
+        }
+        self.set_sessions(Vec::new());
+        self.spawn_load(move |tx| {
+            let sessions = read(&project_name);
+            let _ = tx.send(Loaded::Sessions {
+                project_name,
+                stamp,
+                sessions,
+            });
+        });
     }
 
     pub fn enter_session_detail(&mut self) {
         if self.filtered_sessions.is_empty() {
             return;
         }
-        let session = &self.filtered_sessions[self.selected_session];
-        self.messages =
-            parser::load_session(&self.current_project_name, &session.session_id)
-                .unwrap_or_default();
-        self.scroll_offset = 0;
-        self.screen = Screen::SessionDetail;
+        let session_id = self.filtered_sessions[self.selected_session].session_id.clone();
+        self.open_session(session_id);
+    }
+
+    /// Switch to the detail screen for a session of the current project and
+    /// stream its messages in from the background, a batch at a time, so the
+    /// first page shows before the rest of the transcript has been read.
+    pub fn open_session(&mut self, session_id: String) {
+        let project_name = self.current_project_name.clone();
+        self.stream_messages(move || parser::iter_session(&project_name, &session_id));
+    }
+
+    /// Open the detail screen empty and fill it from the messages `read`
+    /// returns, sent in batches from a background thread. Reading stops at
+    /// the first I/O error, or once the viewer has moved on.
+    fn stream_messages<I>(&mut self, read: impl FnOnce() -> Result<I> + Send + 'static)
+    where
+        I: Iterator<Item = io::Result<Message>>,
+    {
+        self.set_messages(Vec::new());
+        self.spawn_load(move |tx| {
+            let Ok(messages) = read() else {
+                return;
+            };
+            let mut batch = Vec::with_capacity(MESSAGE_BATCH);
+            for message in messages.map_while(Result::ok) {
+                batch.push(message);
+                if batch.len() == MESSAGE_BATCH
+                    && tx.send(Loaded::Messages(std::mem::take(&mut batch))).is_err()
+                {
+                    // The viewer has moved on; stop reading.
+                    return;
+                }
+            }
+            if !batch.is_empty() {
+                let _ = tx.send(Loaded::Messages(batch));
+            }
+        });
+    }
+
+    /// Run `load` on a background thread, replacing (and so abandoning) any
+    /// load still in flight. `load` sends its results on the channel it is
+    /// given; `poll_loading` applies them, and the load counts as finished
+    /// once `load` returns and the channel closes.
+    fn spawn_load(&mut self, load: impl FnOnce(Sender<Loaded>) + Send + 'static) {
+        let (tx, rx) = mpsc::channel();
+        thread::spawn(move || load(tx));
+        self.loading = Some(rx);
+    }
+
+    /// Whether a background load is still running.
+    pub fn is_loading(&self) -> bool {
+        self.loading.is_some()
+    }
+
+    /// Apply whatever the background load has sent since the last poll.
+    /// Returns whether anything changed, i.e. whether the screen needs a redraw.
+    pub fn poll_loading(&mut self) -> bool {
+        let mut changed = false;
+        while let Some(rx) = &self.loading {
+            match rx.try_recv() {
+                Ok(loaded) => self.apply_loaded(loaded),
+                Err(TryRecvError::Empty) => return changed,
+                Err(TryRecvError::Disconnected) => self.loading = None,
+            }
+            changed = true;
+        }
+        changed
+    }
+
+    fn apply_loaded(&mut self, loaded: Loaded) {
+        match loaded {
+            Loaded::Sessions {
+                project_name,
+                stamp,
+                sessions,
+            } => {
+                self.session_cache.insert(&project_name, stamp, &sessions);
+                self.set_sessions(sessions);
+            }
+            // Appended batches are laid out by `layout_step` like any other
+            // messages not yet measured.
+            Loaded::Messages(batch) => self.messages.extend(batch),
+        }
     }
 
     pub fn go_back(&mut self) {
+        // Leaving the screen abandons whatever it was still loading.
+        self.loading = None;
         // 検索中なら検索をキャンセル
         self.search_active = false;
         self.search_query.clear();
@@ -225,6 +380,10 @@ impl App {
             Screen::SessionDetail => {
                 self.screen = Screen::SessionList;
                 self.scroll_offset = 0;
+                // Drop the transcript so no layout work continues on it.
+                self.messages = Vec::new();
+                self.message_line_starts = vec![0];
+                self.visible_timestamps.clear();
             }
             Screen::GlobalSearch => {
                 self.screen = Screen::ProjectList;
@@ -276,7 +435,7 @@ impl App {
                 }
             }
             Screen::SessionDetail => {
-                self.scroll_offset += 1;
+                self.scroll_offset = (self.scroll_offset + 1).min(self.max_scroll());
             }
             Screen::GlobalSearch => {
                 if !self.global_search_filtered.is_empty()
@@ -305,7 +464,7 @@ impl App {
                 }
             }
             Screen::SessionDetail => {
-                self.scroll_offset += half;
+                self.scroll_offset = (self.scroll_offset + half).min(self.max_scroll());
             }
             Screen::GlobalSearch => {
                 if !self.global_search_filtered.is_empty() {
@@ -381,10 +540,89 @@ impl App {
 
     pub fn set_messages(&mut self, messages: Vec<Message>) {
         self.messages = messages;
+        self.message_line_starts = vec![0];
+        self.visible_timestamps.clear();
+        self.layout_step();
         self.scroll_offset = 0;
         self.screen = Screen::SessionDetail;
     }
 
+    /// Whether some messages have not been laid out yet.
+    pub fn layout_pending(&self) -> bool {
+        self.message_line_starts.len() <= self.messages.len()
+    }
+
+    /// Lay out the next chunk of messages for the detail view.
+    pub fn layout_step(&mut self) {
+        let width = self.message_wrap_width();
+        ui::extend_message_layout(
+            &mut self.message_line_starts,
+            &self.messages,
+            width,
+            LAYOUT_CHUNK,
+        );
+    }
+
+    /// Columns message text is wrapped at: the detail pane minus its borders.
+    pub fn message_wrap_width(&self) -> usize {
+        self.terminal_width.saturating_sub(2)
+    }
+
+    /// Rows of message text the detail view shows (tabs, breadcrumb, status
+    /// bar and borders take 5).
+    fn detail_visible_height(&self) -> usize {
+        self.terminal_height.saturating_sub(5)
+    }
+
+    /// Furthest the detail view scrolls: the last row at the bottom of the pane.
+    fn max_scroll(&self) -> usize {
+        let total = self.message_line_starts.last().copied().unwrap_or(0);
+        total.saturating_sub(self.detail_visible_height())
+    }
+
+    /// Laid-out messages with at least one row under the detail view.
+    fn visible_messages(&self) -> Range<usize> {
+        let starts = &self.message_line_starts;
+        let offset = self.scroll_offset.min(self.max_scroll());
+        let bottom = offset + self.detail_visible_height();
+        let first = starts.partition_point(|&start| start <= offset).saturating_sub(1);
+        let end = starts
+            .partition_point(|&start| start < bottom)
+            .min(starts.len() - 1);
+        first..end.max(first)
+    }
+
+    /// Format the header timestamps of the messages about to be drawn,
+    /// keeping those that were already in view.
+    pub fn cache_visible_timestamps(&mut self) {
+        let range = self.visible_messages();
+        self.visible_timestamps.update(&self.messages, range);
+    }
+
+    /// Record the terminal size before a draw. A new width re-wraps the
+    /// messages, keeping the one at the top of the detail view in place.
+    pub fn resize(&mut self, width: usize, height: usize) {
+        self.terminal_height = height;
+        if width != self.terminal_width {
+            self.terminal_width = width;
+            let top = self
+                .message_line_starts
+                .partition_point(|&start| start <= self.scroll_offset)
+                .saturating_sub(1);
+            self.message_line_starts = vec![0];
+            self.layout_step();
+            while self.message_line_starts.len() <= top && self.layout_pending() {
+                self.layout_step();
+            }
+            self.scroll_offset = self.message_line_starts.get(top).copied().unwrap_or(0);
+        }
+        // The rest of the session may still be laid out; until then the view
+        // itself keeps to the rows measured so far.
+        if !self.layout_pending() {
+            self.scroll_offset = self.scroll_offset.min(self.max_scroll());
+        }
+    }
+
     pub fn go_to_bottom(&mut self) {
         match self.screen {
             Screen::ProjectList => {
@@ -398,8 +636,10 @@ impl App {
                 }
             }
             Screen::SessionDetail => {
-                // Scroll to a large value; the UI will clamp it
-                self.scroll_offset = usize::MAX / 2;
+                while self.layout_pending() {
+                    self.layout_step();
+                }
+                self.scroll_offset = self.max_scroll();
             }
             Screen::GlobalSearch => {
                 if !self.global_search_filtered.is_empty() {
@@ -583,12 +823,41 @@ fn run_loop(
     terminal: &mut Terminal<CrosstermBackend<io::Stdout>>,
     app: &mut App,
 ) -> Result<()> {
+    let mut needs_draw = true;
     loop {
-        terminal.draw(|frame| {
-            app.terminal_height = frame.area().height as usize;
-            ui::draw(frame, app);
-        })?;
+        if needs_draw {
+            terminal.draw(|frame| {
+                let area = frame.area();
+                app.resize(area.width as usize, area.height as usize);
+            app.cache_visible_timestamps();
+                ui::draw(frame, app);
+            })?;
+        }
+
+        // Apply whatever a background load has delivered so far. Input is
+        // still checked before the next draw, so a load that keeps sending
+        // cannot hold up keys.
+        needs_draw = app.poll_loading();
+
+        // Finish laying out a long session between key presses, redrawing
+        // after each chunk so input is never blocked behind it.
+        if app.layout_pending() && !event::poll(Duration::ZERO)? {
+            app.layout_step();
+            needs_draw = true;
+            continue;
+        }
+
+        // Keep accepting keys while a background load runs, waking up
+        // regularly to pick up its results; only block on input when there
+        // is nothing else to do.
+        if needs_draw || app.is_loading() {
+            let wait = if needs_draw { Duration::ZERO } else { LOADING_POLL };
+            if !event::poll(wait)? {
+                continue;
+            }
+        }
 
+        needs_draw = true;
         if let Event::Key(key) = event::read()? {
             if app.screen == Screen::GlobalSearch {
                 match key.code {
@@ -600,13 +869,7 @@ fn run_loop(
                             let dir_name = result.dir_name.clone();
                             let session_id = result.session_id.clone();
                             app.current_project_name = dir_name;
-                            if let Ok(msgs) =
-                                parser::load_session(&app.current_project_name, &session_id)
-                            {
-                                app.messages = msgs;
-                                app.scroll_offset = 0;
-                                app.screen = Screen::SessionDetail;
-                            }
+                            app.open_session(session_id);
                         }
                     }
                     KeyCode::Char('y') => {
@@ -718,6 +981,9 @@ fn run_loop(
 #[cfg(test)]
 mod tests {
     use super::*;
+    use chrono::TimeZone;
+    use std::fs;
+    use tempfile::TempDir;
 
     fn make_project(name: &str) -> ProjectInfo {
         ProjectInfo {
@@ -739,6 +1005,10 @@ mod tests {
         }
     }
 
+    fn make_lines(n: usize) -> String {
+        (0..n).map(|i| format!("line {}", i)).collect::<Vec<_>>().join("\n")
+    }
+
     fn make_message(role: MessageRole, text: &str) -> Message {
         Message {
             role,
@@ -813,7 +1083,7 @@ mod tests {
         let mut app = App::with_projects(vec![make_project("a")]);
         app.set_messages(vec![
             make_message(MessageRole::User, "hello"),
-            make_message(MessageRole::Assistant, "hi"),
+            make_message(MessageRole::Assistant, &make_lines(30)),
         ]);
         assert_eq!(app.scroll_offset, 0);
         app.navigate_down();
@@ -822,6 +1092,20 @@ mod tests {
         assert_eq!(app.scroll_offset, 2);
     }
 
+    #[test]
+    fn navigate_down_session_detail_stops_at_last_page() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        app.terminal_height = 24;
+        app.set_messages(vec![make_message(MessageRole::User, &make_lines(30))]);
+        // header + 30 lines, 19 rows visible
+        for _ in 0..20 {
+            app.navigate_down();
+        }
+        assert_eq!(app.scroll_offset, 12);
+        app.navigate_up();
+        assert_eq!(app.scroll_offset, 11);
+    }
+
     #[test]
     fn navigate_up_session_detail() {
         let mut app = App::with_projects(vec![make_project("a")]);
@@ -948,11 +1232,13 @@ mod tests {
     #[test]
     fn half_page_down_session_detail() {
         let mut app = App::with_projects(vec![make_project("a")]);
-        app.set_messages(vec![make_message(MessageRole::User, "hi")]);
+        app.set_messages(vec![make_message(MessageRole::User, &make_lines(40))]);
         app.terminal_height = 24;
         assert_eq!(app.scroll_offset, 0);
         app.half_page_down();
         assert_eq!(app.scroll_offset, 12);
+        app.half_page_down();
+        assert_eq!(app.scroll_offset, 22); // 41 rows - 19 visible
     }
 
     #[test]
@@ -1051,10 +1337,21 @@ mod tests {
 
     #[test]
     fn go_to_bottom_session_detail() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        app.terminal_height = 24;
+        app.set_messages(vec![make_message(MessageRole::User, &make_lines(30))]);
+        app.go_to_bottom();
+        assert_eq!(app.scroll_offset, 12); // 31 rows - 19 visible
+        app.navigate_up();
+        assert_eq!(app.scroll_offset, 11);
+    }
+
+    #[test]
+    fn go_to_bottom_session_detail_short_session_stays_zero() {
         let mut app = App::with_projects(vec![make_project("a")]);
         app.set_messages(vec![make_message(MessageRole::User, "hi")]);
         app.go_to_bottom();
-        assert!(app.scroll_offset > 0);
+        assert_eq!(app.scroll_offset, 0);
     }
 
     #[test]
@@ -1108,6 +1405,20 @@ mod tests {
         assert_eq!(app.selected_session, 0);
     }
 
+    #[test]
+    fn go_back_from_session_detail_drops_pending_layout() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        let messages: Vec<_> = (0..LAYOUT_CHUNK * 2)
+            .map(|_| make_message(MessageRole::User, "hi"))
+            .collect();
+        app.set_messages(messages);
+        assert!(app.layout_pending());
+        app.go_back();
+        assert!(!app.layout_pending());
+        assert!(app.messages.is_empty());
+        assert_eq!(app.message_line_starts, vec![0]);
+    }
+
     #[test]
     fn go_back_from_session_detail_to_session_list() {
         let mut app = App::with_projects(vec![make_project("a")]);
@@ -1213,6 +1524,277 @@ mod tests {
         assert_eq!(app.scroll_offset, 0); // reset to 0
     }
 
+    #[test]
+    fn set_messages_computes_line_starts() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        app.set_messages(vec![
+            make_message(MessageRole::User, "hello\nworld"),
+            make_message(MessageRole::Assistant, "hi"),
+            make_message(MessageRole::System, ""),
+        ]);
+        // header + 2 lines, blank + header + 1 line, blank + header
+        assert_eq!(app.message_line_starts, vec![0, 3, 6, 8]);
+        assert!(!app.layout_pending());
+    }
+
+    #[test]
+    fn cache_visible_timestamps_covers_only_messages_in_view() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        app.terminal_height = 24; // 19 rows visible
+        let mut messages: Vec<_> = (0..30)
+            .map(|_| make_message(MessageRole::User, "hi"))
+            .collect();
+        for (i, msg) in messages.iter_mut().enumerate() {
+            msg.timestamp = Utc.with_ymd_and_hms(2024, 1, 15, 10, i as u32, 0).single();
+        }
+        app.set_messages(messages);
+
+        // Messages start at rows 0, 2, 5, ... 17, 20, ...
+        app.cache_visible_timestamps();
+        assert_eq!(app.visible_timestamps.get(0), Some("2024-01-15 10:00:00"));
+        assert_eq!(app.visible_timestamps.get(6), Some("2024-01-15 10:06:00"));
+        assert_eq!(app.visible_timestamps.get(7), None);
+
+        for _ in 0..3 {
+            app.navigate_down();
+        }
+        app.cache_visible_timestamps();
+        assert_eq!(app.visible_timestamps.get(0), None);
+        assert_eq!(app.visible_timestamps.get(1), Some("2024-01-15 10:01:00"));
+        assert_eq!(app.visible_timestamps.get(7), Some("2024-01-15 10:07:00"));
+        assert_eq!(app.visible_timestamps.get(8), None);
+
+        app.go_back();
+        assert_eq!(app.visible_timestamps.get(1), None);
+    }
+
+    #[test]
+    fn set_messages_counts_wrapped_rows() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        app.terminal_width = 12; // 10 columns inside the borders
+        app.set_messages(vec![
+            make_message(MessageRole::Assistant, &"x".repeat(25)),
+            make_message(MessageRole::User, "aaaa bbbb cccc"),
+        ]);
+        // header + 3 rows, blank + header + "aaaa bbbb " / "cccc"
+        assert_eq!(app.message_line_starts, vec![0, 4, 8]);
+
+        app.terminal_height = 9; // 4 rows visible
+        app.go_to_bottom();
+        assert_eq!(app.scroll_offset, 4);
+    }
+
+    #[test]
+    fn resize_rewraps_messages_and_keeps_top_message() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        app.terminal_height = 8; // 3 rows visible
+        app.set_messages(vec![
+            make_message(MessageRole::User, &"x".repeat(100)),
+            make_message(MessageRole::Assistant, "hi"),
+            make_message(MessageRole::User, "hi"),
+        ]);
+        // 80 columns: header + 2 rows, then 3 + 3
+        assert_eq!(app.message_line_starts, vec![0, 3, 6, 9]);
+        app.scroll_offset = 3;
+
+        app.resize(22, 8);
+        // 20 columns: header + 5 rows, then 3 + 3
+        assert_eq!(app.message_line_starts, vec![0, 6, 9, 12]);
+        assert_eq!(app.scroll_offset, 6);
+
+        app.resize(22, 20);
+        assert_eq!(app.scroll_offset, 0);
+    }
+
+    fn wait_for_load(app: &mut App) {
+        while app.is_loading() {
+            app.poll_loading();
+            std::thread::sleep(Duration::from_millis(1));
+        }
+    }
+
+    #[test]
+    fn background_load_streams_message_batches() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        app.set_messages(Vec::new());
+        app.spawn_load(|tx| {
+            for text in ["one", "two"] {
+                tx.send(Loaded::Messages(vec![make_message(MessageRole::User, text)]))
+                    .unwrap();
+            }
+        });
+        assert!(app.is_loading());
+        wait_for_load(&mut app);
+        assert_eq!(app.screen, Screen::SessionDetail);
+        assert_eq!(app.messages.len(), 2);
+        assert_eq!(app.messages[1].text, "two");
+
+        // Streamed messages are laid out like any other pending ones.
+        assert!(app.layout_pending());
+        app.layout_step();
+        assert_eq!(app.message_line_starts, vec![0, 2, 5]);
+    }
+
+    #[test]
+    fn open_session_streams_transcript_in_batches() {
+        let tmp = TempDir::new().unwrap();
+        let project_dir = tmp.path().join("my-project");
+        fs::create_dir(&project_dir).unwrap();
+        let transcript: String = (0..MESSAGE_BATCH * 2 + 5)
+            .map(|i| format!("{{\"type\":\"user\",\"message\":{{\"content\":\"m{}\"}}}}\n", i))
+            .collect();
+        fs::write(project_dir.join("sess-1.jsonl"), transcript).unwrap();
+
+        let mut app = App::with_projects(vec![make_project("my-project")]);
+        let projects_dir = tmp.path().to_path_buf();
+        app.stream_messages(move || parser::iter_session_in("my-project", "sess-1", &projects_dir));
+        assert_eq!(app.screen, Screen::SessionDetail);
+
+        let batches: Vec<Vec<Message>> = app
+            .loading
+            .take()
+            .unwrap()
+            .iter()
+            .map(|loaded| match loaded {
+                Loaded::Messages(batch) => batch,
+                Loaded::Sessions { .. } => panic!("unexpected session list"),
+            })
+            .collect();
+        let sizes: Vec<_> = batches.iter().map(Vec::len).collect();
+        assert_eq!(sizes, [MESSAGE_BATCH, MESSAGE_BATCH, 5]);
+        let texts: Vec<_> = batches.iter().flatten().map(|m| m.text.clone()).collect();
+        let expected: Vec<_> = (0..MESSAGE_BATCH * 2 + 5).map(|i| format!("m{}", i)).collect();
+        assert_eq!(texts, expected);
+    }
+
+    #[test]
+    fn stream_messages_stops_at_first_read_error() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        app.stream_messages(|| {
+            Ok(vec![
+                Ok(make_message(MessageRole::User, "one")),
+                Ok(make_message(MessageRole::User, "two")),
+                Err(io::Error::other("read failed")),
+                Ok(make_message(MessageRole::User, "three")),
+            ]
+            .into_iter())
+        });
+        wait_for_load(&mut app);
+        let texts: Vec<_> = app.messages.iter().map(|m| m.text.as_str()).collect();
+        assert_eq!(texts, ["one", "two"]);
+    }
+
+    #[test]
+    fn stream_messages_stops_reading_after_go_back() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        // The reader's iterator holds `alive`; it is dropped, closing
+        // `stopped`, only when the loader thread gives up.
+        let (alive, stopped) = mpsc::channel::<()>();
+        app.stream_messages(move || {
+            Ok(std::iter::repeat_with(move || {
+                let _ = &alive;
+                Ok(make_message(MessageRole::User, "again"))
+            }))
+        });
+        app.go_back();
+        assert_eq!(
+            stopped.recv_timeout(Duration::from_secs(5)),
+            Err(mpsc::RecvTimeoutError::Disconnected)
+        );
+    }
+
+    #[test]
+    fn background_load_applies_sessions_when_done() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        app.spawn_load(|tx| {
+            let _ = tx.send(Loaded::Sessions {
+                project_name: "a".to_string(),
+                stamp: None,
+                sessions: vec![make_session("s1"), make_session("s2")],
+            });
+        });
+        wait_for_load(&mut app);
+        assert_eq!(app.screen, Screen::SessionList);
+        assert_eq!(app.filtered_sessions.len(), 2);
+    }
+
+    #[test]
+    fn session_list_cache_reuses_until_files_change() {
+        let tmp = TempDir::new().unwrap();
+        let project_dir = tmp.path().join("my-project");
+        fs::create_dir(&project_dir).unwrap();
+        fs::write(
+            project_dir.join("sess-1.jsonl"),
+            r#"{"type":"user","timestamp":"2024-01-15T10:30:00Z","message":{"content":"first"}}"#,
+        )
+        .unwrap();
+
+        let mut app = App::with_projects(vec![make_project("my-project")]);
+        let show = |app: &mut App| {
+            let projects_dir = tmp.path().to_path_buf();
+            let stamp = parser::project_stamp_in("my-project", &projects_dir);
+            app.show_session_list("my-project".to_string(), stamp, move |name| {
+                parser::list_sessions_in(name, &projects_dir, None).unwrap_or_default()
+            });
+        };
+
+        show(&mut app);
+        assert!(app.is_loading());
+        wait_for_load(&mut app);
+        assert_eq!(app.sessions.len(), 1);
+
+        // Unchanged files: shown from the cache without a background read.
+        show(&mut app);
+        assert!(!app.is_loading());
+        assert_eq!(app.sessions.len(), 1);
+
+        fs::write(
+            project_dir.join("sess-2.jsonl"),
+            r#"{"type":"user","timestamp":"2024-01-16T10:30:00Z","message":{"content":"second"}}"#,
+        )
+        .unwrap();
+        show(&mut app);
+        assert!(app.is_loading());
+        wait_for_load(&mut app);
+        assert_eq!(app.sessions.len(), 2);
+        assert_eq!(app.sessions[0].preview, "second");
+    }
+
+    #[test]
+    fn go_back_abandons_background_load() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        app.set_messages(Vec::new());
+        app.spawn_load(|tx| {
+            let _ = tx.send(Loaded::Messages(vec![make_message(MessageRole::User, "late")]));
+        });
+        app.go_back();
+        assert!(!app.is_loading());
+        assert!(!app.poll_loading());
+        assert_eq!(app.screen, Screen::SessionList);
+        assert!(app.messages.is_empty());
+    }
+
+    #[test]
+    fn layout_step_lays_out_long_sessions_in_chunks() {
+        let mut app = App::with_projects(vec![make_project("a")]);
+        let messages: Vec<_> = (0..LAYOUT_CHUNK * 2 + 1)
+            .map(|_| make_message(MessageRole::User, "hi"))
+            .collect();
+        app.set_messages(messages);
+        assert_eq!(app.message_line_starts.len(), LAYOUT_CHUNK + 1);
+        assert!(app.layout_pending());
+
+        app.layout_step();
+        app.layout_step();
+        assert!(!app.layout_pending());
+        assert_eq!(app.message_line_starts.len(), app.messages.len() + 1);
+        // 2 lines for the first message, 3 (with separator) for each other
+        assert_eq!(
+            app.message_line_starts.last().copied(),
+            Some(2 + 3 * LAYOUT_CHUNK * 2)
+        );
+    }
+
     // ===== 空リスト安全性テスト =====
 
     #[test]
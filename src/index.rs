@@ -1,5 +1,6 @@
 use anyhow::Result;
 use rusqlite::Connection;
+use std::collections::HashMap;
 use std::path::Path;
 
 pub struct SessionRecord {
@@ -120,13 +121,35 @@ impl SessionIndex {
         }
     }
 
+    /// Stored file mtimes of every indexed session, keyed by session_id.
+    pub fn all_file_mtimes(&self) -> Result<HashMap<String, i64>> {
+        let mut stmt = self
+            .conn
+            .prepare("SELECT session_id, file_mtime FROM sessions")?;
+        let mtimes = stmt
+            .query_map([], |row| Ok((row.get::<_, String>(0)?, row.get::<_, i64>(1)?)))?
+            .filter_map(|r| r.ok())
+            .collect();
+        Ok(mtimes)
+    }
+
     pub fn search_all(&self) -> Result<Vec<SearchableSession>> {
         let mut sessions_stmt = self.conn.prepare(
             "SELECT session_id, project_path, dir_name, git_branch, summary, created_at FROM sessions ORDER BY created_at DESC",
         )?;
+
+        // Read every prompt in one query and group by session, rather than
+        // querying user_prompts once per session.
         let mut prompts_stmt = self
             .conn
-            .prepare("SELECT prompt FROM user_prompts WHERE session_id = ?1 ORDER BY id")?;
+            .prepare("SELECT session_id, prompt FROM user_prompts ORDER BY id")?;
+        let mut prompts_by_session: HashMap<String, Vec<String>> = HashMap::new();
+        let prompt_rows = prompts_stmt.query_map([], |row| {
+            Ok((row.get::<_, String>(0)?, row.get::<_, String>(1)?))
+        })?;
+        for (session_id, prompt) in prompt_rows.filter_map(|r| r.ok()) {
+            prompts_by_session.entry(session_id).or_default().push(prompt);
+        }
 
         let mut results = Vec::new();
         let session_rows = sessions_stmt.query_map([], |row| {
@@ -143,10 +166,7 @@ impl SessionIndex {
         for session_row in session_rows {
             let (session_id, project_path, dir_name, git_branch, summary, created_at) =
                 session_row?;
-            let prompts: Vec<String> = prompts_stmt
-                .query_map([&session_id], |row| row.get(0))?
-                .filter_map(|r| r.ok())
-                .collect();
+            let prompts = prompts_by_session.remove(&session_id).unwrap_or_default();
 
             results.push(SearchableSession {
                 session_id,
@@ -281,6 +301,36 @@ mod tests {
         assert_eq!(mtime, Some(1700000000));
     }
 
+    #[test]
+    fn all_file_mtimes_maps_every_session() {
+        let tmp = TempDir::new().unwrap();
+        let db_path = tmp.path().join("test.db");
+        let index = SessionIndex::open(&db_path).unwrap();
+        assert!(index.all_file_mtimes().unwrap().is_empty());
+
+        for (session_id, file_mtime) in [("sess-1", 1700000000), ("sess-2", 1700000500)] {
+            index
+                .upsert_session(&SessionRecord {
+                    session_id: session_id.to_string(),
+                    project_path: "/project".to_string(),
+                    dir_name: "-project".to_string(),
+                    git_branch: "".to_string(),
+                    summary: "".to_string(),
+                    first_prompt: "".to_string(),
+                    message_count: 0,
+                    created_at: "".to_string(),
+                    modified_at: "".to_string(),
+                    file_mtime,
+                })
+                .unwrap();
+        }
+
+        let mtimes = index.all_file_mtimes().unwrap();
+        assert_eq!(mtimes.len(), 2);
+        assert_eq!(mtimes["sess-1"], 1700000000);
+        assert_eq!(mtimes["sess-2"], 1700000500);
+    }
+
     #[test]
     fn upsert_session_updates_existing() {
         let tmp = TempDir::new().unwrap();
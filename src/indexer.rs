@@ -15,15 +15,20 @@ fn default_projects_dir() -> Option<PathBuf> {
 pub fn build_index(db_path: &Path, projects_dir: &Path) -> Result<()> {
     let index = SessionIndex::open(db_path)?;
 
-    if !projects_dir.exists() {
-        return Ok(());
-    }
+    let read_dir = match fs::read_dir(projects_dir) {
+        Ok(rd) => rd,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(()),
+        Err(e) => return Err(e.into()),
+    };
 
-    let project_dirs: Vec<_> = fs::read_dir(projects_dir)?
+    let project_dirs: Vec<_> = read_dir
         .filter_map(|e| e.ok())
         .filter(|e| e.file_type().map(|ft| ft.is_dir()).unwrap_or(false))
         .collect();
 
+    // One query for every stored mtime instead of one lookup per file.
+    let stored_mtimes = index.all_file_mtimes()?;
+
     for project_entry in &project_dirs {
         let dir_name = project_entry.file_name().to_string_lossy().to_string();
         let project_dir = project_entry.path();
@@ -34,12 +39,7 @@ pub fn build_index(db_path: &Path, projects_dir: &Path) -> Result<()> {
             .into_iter()
             .flatten()
             .filter_map(|e| e.ok())
-            .filter(|e| {
-                e.path()
-                    .extension()
-                    .map(|ext| ext == "jsonl")
-                    .unwrap_or(false)
-            })
+            .filter(|e| parser::is_session_file_name(&e.file_name()))
             .collect();
 
         for jsonl_entry in &jsonl_files {
@@ -56,10 +56,8 @@ pub fn build_index(db_path: &Path, projects_dir: &Path) -> Result<()> {
                 .map(|d| d.as_millis() as i64)
                 .unwrap_or(0);
 
-            if let Some(stored_mtime) = index.get_file_mtime(&session_id)? {
-                if stored_mtime == file_mtime {
-                    continue;
-                }
+            if stored_mtimes.get(&session_id) == Some(&file_mtime) {
+                continue;
             }
 
             let meta = index_metadata.get(&session_id);
@@ -189,41 +187,24 @@ fn read_index_metadata(project_dir: &Path) -> std::collections::HashMap<String,
 }
 
 fn extract_user_prompts(jsonl_path: &Path) -> Vec<PromptRecord> {
-    let content = match fs::read_to_string(jsonl_path) {
-        Ok(c) => c,
-        Err(_) => return Vec::new(),
-    };
     let mut prompts = Vec::new();
-    for line in content.lines() {
-        let line = line.trim();
-        if line.is_empty() {
-            continue;
-        }
-        let obj: serde_json::Value = match serde_json::from_str(line) {
+    let _ = parser::for_each_jsonl_line(jsonl_path, |line| {
+        let mut raw: parser::RawLine = match serde_json::from_slice(line) {
             Ok(v) => v,
-            Err(_) => continue,
+            Err(_) => return,
         };
-        if obj.get("type").and_then(|v| v.as_str()) != Some("user") {
-            continue;
+        if raw.kind != Some(parser::LineKind::User) {
+            return;
         }
-        let msg_content = obj
-            .get("message")
-            .and_then(|m| m.get("content"))
-            .cloned()
-            .unwrap_or(serde_json::Value::String(String::new()));
-        let text = parser::extract_text_from_content(&msg_content);
+        let text = parser::extract_text_from_content(&raw.take_content());
         if text.is_empty() {
-            continue;
+            return;
         }
-        let timestamp = obj
-            .get("timestamp")
-            .and_then(|v| v.as_str())
-            .map(String::from);
         prompts.push(PromptRecord {
             prompt: text,
-            timestamp,
+            timestamp: raw.timestamp,
         });
-    }
+    });
     prompts
 }
 
@@ -1,23 +1,85 @@
 use crate::models::{Message, MessageRole, ProjectInfo, SessionInfo};
 use anyhow::Result;
-use chrono::{DateTime, Utc};
+use chrono::{DateTime, NaiveDate, Utc};
+use rayon::prelude::*;
+use serde::{de, Deserialize, Serialize};
 use serde_json::Value;
-use std::fs;
+use std::borrow::Cow;
+use std::cmp::Reverse;
+use std::collections::HashMap;
+use std::ffi::OsStr;
+use std::fs::{self, File};
+use std::io::{self, BufRead, BufReader};
+use std::marker::PhantomData;
 use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::time::SystemTime;
 
 pub(crate) fn truncate_str(s: &str, max_chars: usize) -> String {
-    if s.chars().count() <= max_chars {
-        s.to_string()
-    } else {
-        let truncated: String = s.chars().take(max_chars).collect();
-        format!("{}...", truncated)
+    // Only the first `max_chars + 1` chars are looked at, however long `s` is.
+    match s.char_indices().nth(max_chars) {
+        None => s.to_string(),
+        Some((end, _)) => format!("{}...", &s[..end]),
+    }
+}
+
+/// `truncate_str` of `parts` joined with newlines, copying no more than the
+/// prefix that decides the result instead of building the whole join.
+fn truncate_joined<'a>(parts: impl IntoIterator<Item = &'a str>, max_chars: usize) -> String {
+    let mut joined = String::new();
+    let mut joined_chars = 0;
+    for (i, part) in parts.into_iter().enumerate() {
+        if joined_chars > max_chars {
+            break;
+        }
+        if i > 0 {
+            joined.push('\n');
+            joined_chars += 1;
+        }
+        // One char past the limit is enough to know the result is truncated.
+        let room = (max_chars + 1).saturating_sub(joined_chars);
+        let end = part.char_indices().nth(room).map_or(part.len(), |(end, _)| end);
+        joined.push_str(&part[..end]);
+        joined_chars += part[..end].chars().count();
     }
+    truncate_str(&joined, max_chars)
 }
 
 fn claude_projects_dir() -> Option<PathBuf> {
     dirs::home_dir().map(|h| h.join(".claude").join("projects"))
 }
 
+/// Where per-project summaries of JSONL-only projects are cached between runs.
+fn summary_cache_dir() -> Option<PathBuf> {
+    dirs::cache_dir().map(|c| c.join("cc-sessions-viewer").join("sessions"))
+}
+
+/// Whether a directory entry name is a session transcript (`<id>.jsonl`).
+///
+/// Works on the bare file name so callers can filter `read_dir` entries
+/// without joining a full path for each one.
+pub(crate) fn is_session_file_name(name: &OsStr) -> bool {
+    Path::new(name).extension().is_some_and(|ext| ext == "jsonl")
+}
+
+/// Hosting domains recognised in encoded project names, as (encoded, decoded).
+const KNOWN_DOMAINS: &[(&str, &str)] = &[
+    ("tech-pepabo-com", "tech.pepabo.com"),
+    ("git-pepabo-com", "git.pepabo.com"),
+    ("github-com", "github.com"),
+    ("gitlab-com", "gitlab.com"),
+    ("bitbucket-org", "bitbucket.org"),
+];
+
+/// If `rest` starts with a known domain followed by `-` or the end of the
+/// name, return its encoded length and decoded form.
+fn match_known_domain(rest: &str) -> Option<(usize, &'static str)> {
+    KNOWN_DOMAINS.iter().find_map(|&(encoded, decoded)| {
+        let tail = rest.strip_prefix(encoded)?;
+        (tail.is_empty() || tail.starts_with('-')).then_some((encoded.len(), decoded))
+    })
+}
+
 /// Decode a project directory name back to the original filesystem path.
 ///
 /// Encoding replaces all `/` and `.` with `-`, so exact recovery is impossible.
@@ -28,58 +90,364 @@ pub(crate) fn decode_project_path(dir_name: &str) -> String {
         return dir_name.to_string();
     }
 
-    let encoded = dir_name.trim_start_matches('-');
-
-    let domain_replacements: &[(&str, &str)] = &[
-        ("-tech-pepabo-com-", "/tech.pepabo.com/"),
-        ("-git-pepabo-com-", "/git.pepabo.com/"),
-        ("-github-com-", "/github.com/"),
-        ("-gitlab-com-", "/gitlab.com/"),
-        ("-bitbucket-org-", "/bitbucket.org/"),
-    ];
-
-    let mut encoded = encoded.to_string();
-    for (old, new) in domain_replacements {
-        encoded = encoded.replace(old, new);
-    }
-
-    let domain_endings: &[(&str, &str)] = &[
-        ("-tech-pepabo-com", "/tech.pepabo.com"),
-        ("-git-pepabo-com", "/git.pepabo.com"),
-        ("-github-com", "/github.com"),
-        ("-gitlab-com", "/gitlab.com"),
-        ("-bitbucket-org", "/bitbucket.org"),
-    ];
-    for (old, new) in domain_endings {
-        if encoded.ends_with(old) {
-            let prefix = &encoded[..encoded.len() - old.len()];
-            encoded = format!("{}{}", prefix, new);
-            break;
+    // Single left-to-right pass: each `-` becomes `/`, and a known domain
+    // right after a separator keeps its dots.
+    let mut rest = dir_name.trim_start_matches('-');
+    let mut decoded = String::with_capacity(rest.len() + 1);
+    decoded.push('/');
+    while let Some(pos) = rest.find('-') {
+        decoded.push_str(&rest[..pos]);
+        decoded.push('/');
+        rest = &rest[pos + 1..];
+        if let Some((len, domain)) = match_known_domain(rest) {
+            decoded.push_str(domain);
+            rest = &rest[len..];
         }
     }
+    decoded.push_str(rest);
+    decoded
+}
 
-    format!("/{}", encoded.replace('-', "/"))
+/// The fields of a JSONL transcript line that the viewer reads.
+///
+/// Deserializing into this rather than a `Value` lets serde skip everything
+/// else on the line (tool results, file snapshots, usage, ...) without
+/// allocating it. Optional fields of an unexpected JSON type read as absent
+/// rather than rejecting the whole line.
+#[derive(Deserialize)]
+pub(crate) struct RawLine {
+    #[serde(rename = "type", default)]
+    pub kind: Option<LineKind>,
+    #[serde(default, deserialize_with = "lenient_string")]
+    pub subtype: Option<String>,
+    #[serde(default, deserialize_with = "lenient_string")]
+    pub timestamp: Option<String>,
+    #[serde(rename = "gitBranch", default, deserialize_with = "lenient_string")]
+    pub git_branch: Option<String>,
+    #[serde(default)]
+    pub message: Option<RawMessage>,
 }
 
-/// Try to read originalPath (or projectPath from entries) from sessions-index.json.
-fn try_get_original_path(project_dir: &Path) -> Option<String> {
-    let index_path = project_dir.join("sessions-index.json");
-    let content = fs::read_to_string(&index_path).ok()?;
-    let data: Value = serde_json::from_str(&content).ok()?;
+/// A string field, or `None` when it holds any other JSON value.
+fn lenient_string<'de, D: de::Deserializer<'de>>(deserializer: D) -> Result<Option<String>, D::Error> {
+    Ok(match Value::deserialize(deserializer)? {
+        Value::String(s) => Some(s),
+        _ => None,
+    })
+}
+
+/// The `type` of a transcript line, read without allocating a String.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Deserialize)]
+#[serde(rename_all = "lowercase")]
+pub(crate) enum LineKind {
+    User,
+    Assistant,
+    System,
+    /// Any other type ("summary", "progress", "file-history-snapshot", ...).
+    #[serde(other)]
+    Other,
+}
+
+/// `message` of a transcript line. Only `content` is kept; a `message` that
+/// is not an object reads as having no content.
+pub(crate) struct RawMessage {
+    pub content: Value,
+}
 
-    if let Some(orig) = data.get("originalPath").and_then(Value::as_str) {
-        return Some(orig.to_string());
+#[derive(Deserialize)]
+#[serde(field_identifier, rename_all = "lowercase")]
+enum RawMessageField {
+    Content,
+    #[serde(other)]
+    Other,
+}
+
+impl<'de> Deserialize<'de> for RawMessage {
+    fn deserialize<D: de::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct MessageVisitor;
+
+        impl<'de> de::Visitor<'de> for MessageVisitor {
+            type Value = RawMessage;
+
+            fn expecting(&self, f: &mut std::fmt::Formatter) -> std::fmt::Result {
+                f.write_str("a message")
+            }
+
+            fn visit_map<A: de::MapAccess<'de>>(self, mut map: A) -> Result<Self::Value, A::Error> {
+                let mut content = Value::Null;
+                while let Some(field) = map.next_key::<RawMessageField>()? {
+                    match field {
+                        RawMessageField::Content => content = map.next_value()?,
+                        RawMessageField::Other => {
+                            map.next_value::<de::IgnoredAny>()?;
+                        }
+                    }
+                }
+                Ok(RawMessage { content })
+            }
+
+            fn visit_seq<A: de::SeqAccess<'de>>(self, mut seq: A) -> Result<Self::Value, A::Error> {
+                while seq.next_element::<de::IgnoredAny>()?.is_some() {}
+                Ok(RawMessage { content: Value::Null })
+            }
+
+            fn visit_str<E: de::Error>(self, _: &str) -> Result<Self::Value, E> {
+                Ok(RawMessage { content: Value::Null })
+            }
+
+            fn visit_unit<E: de::Error>(self) -> Result<Self::Value, E> {
+                Ok(RawMessage { content: Value::Null })
+            }
+
+            fn visit_bool<E: de::Error>(self, _: bool) -> Result<Self::Value, E> {
+                Ok(RawMessage { content: Value::Null })
+            }
+
+            fn visit_i64<E: de::Error>(self, _: i64) -> Result<Self::Value, E> {
+                Ok(RawMessage { content: Value::Null })
+            }
+
+            fn visit_u64<E: de::Error>(self, _: u64) -> Result<Self::Value, E> {
+                Ok(RawMessage { content: Value::Null })
+            }
+
+            fn visit_f64<E: de::Error>(self, _: f64) -> Result<Self::Value, E> {
+                Ok(RawMessage { content: Value::Null })
+            }
+        }
+
+        deserializer.deserialize_any(MessageVisitor)
+    }
+}
+
+impl RawLine {
+    /// Take `message.content`, or `Value::Null` when absent.
+    pub fn take_content(&mut self) -> Value {
+        self.message
+            .take()
+            .map(|m| m.content)
+            .unwrap_or_default()
     }
+}
+
+/// Only the `type` of a transcript line. Used to classify lines when
+/// summarizing a session; serde validates and skips the rest without allocating.
+#[derive(Deserialize)]
+struct RawLineType {
+    #[serde(rename = "type", default)]
+    kind: Option<LineKind>,
+}
+
+/// The fields of a user line needed for a session preview. Text is borrowed
+/// from the line where it has no escapes, and other content blocks (tool
+/// results, images) are skipped without building a `Value`.
+#[derive(Deserialize)]
+struct RawPreviewLine<'a> {
+    #[serde(borrow, default)]
+    timestamp: Option<Cow<'a, str>>,
+    #[serde(rename = "gitBranch", default)]
+    git_branch: Option<String>,
+    #[serde(borrow, default)]
+    message: Option<RawPreviewMessage<'a>>,
+}
+
+#[derive(Deserialize)]
+struct RawPreviewMessage<'a> {
+    #[serde(borrow, default)]
+    content: PreviewContent<'a>,
+}
+
+#[derive(Deserialize)]
+struct RawPreviewBlock<'a> {
+    #[serde(rename = "type", borrow, default)]
+    kind: Option<&'a str>,
+    #[serde(borrow, default)]
+    text: Option<Cow<'a, str>>,
+}
+
+/// `message.content` reduced to its text, as `extract_text_from_content` sees it.
+#[derive(Default)]
+enum PreviewContent<'a> {
+    Text(Cow<'a, str>),
+    Blocks(Vec<Cow<'a, str>>),
+    #[default]
+    Other,
+}
+
+impl<'de: 'a, 'a> Deserialize<'de> for PreviewContent<'a> {
+    fn deserialize<D: de::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct ContentVisitor<'a>(PhantomData<&'a ()>);
+
+        impl<'de: 'a, 'a> de::Visitor<'de> for ContentVisitor<'a> {
+            type Value = PreviewContent<'a>;
+
+            fn expecting(&self, f: &mut std::fmt::Formatter) -> std::fmt::Result {
+                f.write_str("message content")
+            }
+
+            fn visit_borrowed_str<E: de::Error>(self, v: &'de str) -> Result<Self::Value, E> {
+                Ok(PreviewContent::Text(Cow::Borrowed(v)))
+            }
+
+            fn visit_str<E: de::Error>(self, v: &str) -> Result<Self::Value, E> {
+                Ok(PreviewContent::Text(Cow::Owned(v.to_string())))
+            }
+
+            fn visit_string<E: de::Error>(self, v: String) -> Result<Self::Value, E> {
+                Ok(PreviewContent::Text(Cow::Owned(v)))
+            }
+
+            fn visit_seq<A: de::SeqAccess<'de>>(self, mut seq: A) -> Result<Self::Value, A::Error> {
+                let mut texts = Vec::new();
+                while let Some(block) = seq.next_element::<RawPreviewBlock<'a>>()? {
+                    if let (Some("text"), Some(text)) = (block.kind, block.text) {
+                        texts.push(text);
+                    }
+                }
+                Ok(PreviewContent::Blocks(texts))
+            }
+
+            fn visit_map<A: de::MapAccess<'de>>(self, mut map: A) -> Result<Self::Value, A::Error> {
+                while map.next_entry::<de::IgnoredAny, de::IgnoredAny>()?.is_some() {}
+                Ok(PreviewContent::Other)
+            }
+
+            fn visit_unit<E: de::Error>(self) -> Result<Self::Value, E> {
+                Ok(PreviewContent::Other)
+            }
+
+            fn visit_bool<E: de::Error>(self, _: bool) -> Result<Self::Value, E> {
+                Ok(PreviewContent::Other)
+            }
+
+            fn visit_i64<E: de::Error>(self, _: i64) -> Result<Self::Value, E> {
+                Ok(PreviewContent::Other)
+            }
+
+            fn visit_u64<E: de::Error>(self, _: u64) -> Result<Self::Value, E> {
+                Ok(PreviewContent::Other)
+            }
+
+            fn visit_f64<E: de::Error>(self, _: f64) -> Result<Self::Value, E> {
+                Ok(PreviewContent::Other)
+            }
+        }
+
+        deserializer.deserialize_any(ContentVisitor(PhantomData))
+    }
+}
+
+/// Preview text, timestamp and branch of a user line.
+///
+/// Reads the line through `RawPreviewLine`; lines it cannot represent (say, a
+/// content array holding something other than objects) fall back to a full
+/// `RawLine` parse so the result always matches `extract_text_from_content`.
+fn preview_from_user_line(line: &[u8]) -> Option<(String, Option<DateTime<Utc>>, String)> {
+    if let Ok(raw) = serde_json::from_slice::<RawPreviewLine>(line) {
+        let content = raw.message.map(|m| m.content).unwrap_or_default();
+        let preview = match content {
+            PreviewContent::Text(text) => truncate_str(&text, 200),
+            PreviewContent::Blocks(texts) => truncate_joined(texts.iter().map(|t| t.as_ref()), 200),
+            PreviewContent::Other => String::new(),
+        };
+        let timestamp = parse_timestamp(raw.timestamp.as_deref());
+        return Some((preview, timestamp, raw.git_branch.unwrap_or_default()));
+    }
+
+    let mut raw: RawLine = serde_json::from_slice(line).ok()?;
+    let preview = truncate_str(&extract_text_from_content(&raw.take_content()), 200);
+    let timestamp = parse_timestamp(raw.timestamp.as_deref());
+    Some((preview, timestamp, raw.git_branch.unwrap_or_default()))
+}
+
+/// The parts of sessions-index.json the project list reads. Fields of an
+/// unexpected JSON type read as absent, as with `Value` lookups.
+#[derive(Deserialize)]
+struct RawIndexSummary {
+    #[serde(rename = "originalPath", default, deserialize_with = "lenient_string")]
+    original_path: Option<String>,
+    #[serde(default)]
+    entries: IndexEntriesSummary,
+}
+
+/// `entries` reduced to their number and the first one's projectPath; only
+/// that entry is built as a `Value`. Anything but an array reads as no entries.
+#[derive(Default)]
+struct IndexEntriesSummary {
+    count: usize,
+    first_project_path: Option<String>,
+}
+
+impl<'de> Deserialize<'de> for IndexEntriesSummary {
+    fn deserialize<D: de::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct EntriesVisitor;
+
+        impl<'de> de::Visitor<'de> for EntriesVisitor {
+            type Value = IndexEntriesSummary;
+
+            fn expecting(&self, f: &mut std::fmt::Formatter) -> std::fmt::Result {
+                f.write_str("index entries")
+            }
+
+            fn visit_seq<A: de::SeqAccess<'de>>(self, mut seq: A) -> Result<Self::Value, A::Error> {
+                let mut summary = IndexEntriesSummary::default();
+                if let Some(first) = seq.next_element::<Value>()? {
+                    summary.count = 1;
+                    if let Value::Object(mut entry) = first {
+                        if let Some(Value::String(path)) = entry.remove("projectPath") {
+                            summary.first_project_path = Some(path);
+                        }
+                    }
+                }
+                while seq.next_element::<de::IgnoredAny>()?.is_some() {
+                    summary.count += 1;
+                }
+                Ok(summary)
+            }
+
+            fn visit_map<A: de::MapAccess<'de>>(self, mut map: A) -> Result<Self::Value, A::Error> {
+                while map.next_entry::<de::IgnoredAny, de::IgnoredAny>()?.is_some() {}
+                Ok(IndexEntriesSummary::default())
+            }
+
+            fn visit_str<E: de::Error>(self, _: &str) -> Result<Self::Value, E> {
+                Ok(IndexEntriesSummary::default())
+            }
+
+            fn visit_unit<E: de::Error>(self) -> Result<Self::Value, E> {
+                Ok(IndexEntriesSummary::default())
+            }
+
+            fn visit_bool<E: de::Error>(self, _: bool) -> Result<Self::Value, E> {
+                Ok(IndexEntriesSummary::default())
+            }
+
+            fn visit_i64<E: de::Error>(self, _: i64) -> Result<Self::Value, E> {
+                Ok(IndexEntriesSummary::default())
+            }
+
+            fn visit_u64<E: de::Error>(self, _: u64) -> Result<Self::Value, E> {
+                Ok(IndexEntriesSummary::default())
+            }
 
-    if let Some(entries) = data.get("entries").and_then(Value::as_array) {
-        if let Some(first) = entries.first() {
-            if let Some(pp) = first.get("projectPath").and_then(Value::as_str) {
-                return Some(pp.to_string());
+            fn visit_f64<E: de::Error>(self, _: f64) -> Result<Self::Value, E> {
+                Ok(IndexEntriesSummary::default())
             }
         }
+
+        deserializer.deserialize_any(EntriesVisitor)
     }
+}
+
+/// Read sessions-index.json once for the project list: originalPath (or
+/// projectPath from the first entry), and the number of sessions it lists.
+fn read_index_summary(project_dir: &Path) -> Option<(Option<String>, usize)> {
+    let index_path = project_dir.join("sessions-index.json");
+    let content = fs::read_to_string(&index_path).ok()?;
+    let data: RawIndexSummary = serde_json::from_str(&content).ok()?;
 
-    None
+    let original_path = data.original_path.or(data.entries.first_project_path);
+    Some((original_path, data.entries.count))
 }
 
 /// Parse an ISO 8601 timestamp string (e.g. "2026-01-30T03:17:44.781Z") into DateTime<Utc>.
@@ -88,8 +456,46 @@ pub(crate) fn parse_timestamp(ts: Option<&str>) -> Option<DateTime<Utc>> {
     if ts.is_empty() {
         return None;
     }
-    // chrono can parse RFC 3339 / ISO 8601 directly
-    ts.parse::<DateTime<Utc>>().ok()
+    // Transcripts use one fixed UTC format; anything else goes through
+    // chrono's general RFC 3339 / ISO 8601 parser.
+    parse_utc_timestamp_fast(ts).or_else(|| ts.parse::<DateTime<Utc>>().ok())
+}
+
+/// Parse the `YYYY-MM-DDTHH:MM:SS[.fraction]Z` form that Claude Code writes by
+/// reading the digits in place. Returns `None` for any other form (offsets,
+/// leap seconds, over-long fractions), which the caller hands to chrono.
+fn parse_utc_timestamp_fast(ts: &str) -> Option<DateTime<Utc>> {
+    fn digits(bytes: &[u8]) -> Option<u32> {
+        bytes.iter().try_fold(0u32, |n, &b| {
+            b.is_ascii_digit().then(|| n * 10 + u32::from(b - b'0'))
+        })
+    }
+
+    let b = ts.as_bytes();
+    if b.len() < 20
+        || b[4] != b'-'
+        || b[7] != b'-'
+        || b[10] != b'T'
+        || b[13] != b':'
+        || b[16] != b':'
+        || b[b.len() - 1] != b'Z'
+    {
+        return None;
+    }
+    let nanos = match &b[19..b.len() - 1] {
+        [] => 0,
+        [b'.', fraction @ ..] if (1..=9).contains(&fraction.len()) => {
+            digits(fraction)? * 10u32.pow(9 - fraction.len() as u32)
+        }
+        _ => return None,
+    };
+    let second = digits(&b[17..19])?;
+    if second > 59 {
+        return None;
+    }
+    NaiveDate::from_ymd_opt(digits(&b[0..4])? as i32, digits(&b[5..7])?, digits(&b[8..10])?)?
+        .and_hms_nano_opt(digits(&b[11..13])?, digits(&b[14..16])?, second, nanos)
+        .map(|dt| dt.and_utc())
 }
 
 /// Extract text from content which can be a string or an array of content blocks.
@@ -98,36 +504,31 @@ pub(crate) fn extract_text_from_content(content: &Value) -> String {
     match content {
         Value::String(s) => s.clone(),
         Value::Array(arr) => {
-            let texts: Vec<&str> = arr
-                .iter()
-                .filter_map(|block| {
-                    if block.get("type")?.as_str()? == "text" {
-                        block.get("text")?.as_str()
-                    } else {
-                        None
-                    }
-                })
-                .collect();
-            texts.join("\n")
+            // Most content arrays carry a single text block: copy it directly
+            // instead of going through an intermediate Vec and join.
+            if let [block] = arr.as_slice() {
+                return text_block(block).unwrap_or_default().to_string();
+            }
+            let mut text = String::new();
+            for (i, t) in arr.iter().filter_map(text_block).enumerate() {
+                if i > 0 {
+                    text.push('\n');
+                }
+                text.push_str(t);
+            }
+            text
         }
         _ => String::new(),
     }
 }
 
-/// Extract tool_use / tool_result blocks from a content array.
-pub(crate) fn extract_tool_blocks(content: &Value) -> Vec<&Value> {
-    match content {
-        Value::Array(arr) => arr
-            .iter()
-            .filter(|block| {
-                if let Some(t) = block.get("type").and_then(Value::as_str) {
-                    t == "tool_use" || t == "tool_result"
-                } else {
-                    false
-                }
-            })
-            .collect(),
-        _ => Vec::new(),
+/// The text of a `{"type": "text", "text": ...}` block, if `block` is one.
+fn text_block(block: &Value) -> Option<&str> {
+    let obj = block.as_object()?;
+    if obj.get("type")?.as_str()? == "text" {
+        obj.get("text")?.as_str()
+    } else {
+        None
     }
 }
 
@@ -197,37 +598,40 @@ pub fn list_projects() -> Result<Vec<ProjectInfo>> {
 }
 
 pub(crate) fn list_projects_in(projects_dir: &Path) -> Result<Vec<ProjectInfo>> {
-    if !projects_dir.exists() {
-        return Ok(Vec::new());
-    }
+    let read_dir = match fs::read_dir(projects_dir) {
+        Ok(rd) => rd,
+        Err(e) if e.kind() == io::ErrorKind::NotFound => return Ok(Vec::new()),
+        Err(e) => return Err(e.into()),
+    };
 
-    let mut entries: Vec<_> = fs::read_dir(projects_dir)?
+    // file_type() comes from the directory listing itself on most platforms,
+    // so this does not stat each entry.
+    let mut entries: Vec<(String, PathBuf)> = read_dir
         .filter_map(|e| e.ok())
         .filter(|e| e.file_type().map(|ft| ft.is_dir()).unwrap_or(false))
+        .map(|e| (e.file_name().to_string_lossy().into_owned(), e.path()))
         .collect();
 
-    entries.sort_by(|a, b| a.file_name().cmp(&b.file_name()));
-
-    let mut projects = Vec::new();
-    for entry in entries {
-        let dir_name = entry.file_name().to_string_lossy().to_string();
-        let dir_path = entry.path();
-
-        let original_path = try_get_original_path(&dir_path)
-            .unwrap_or_else(|| decode_project_path(&dir_name));
-
-        let session_count = fs::read_dir(&dir_path)
-            .map(|rd| {
-                rd.filter_map(|e| e.ok())
-                    .filter(|e| {
-                        e.path()
-                            .extension()
-                            .map(|ext| ext == "jsonl")
-                            .unwrap_or(false)
-                    })
-                    .count()
-            })
-            .unwrap_or(0);
+    entries.sort_by(|a, b| a.0.cmp(&b.0));
+
+    let mut projects = Vec::with_capacity(entries.len());
+    for (dir_name, dir_path) in entries {
+        let (original_path, index_count) = read_index_summary(&dir_path).unwrap_or_default();
+        let original_path = original_path.unwrap_or_else(|| decode_project_path(&dir_name));
+
+        // A non-empty index is what list_sessions shows, so its length is the
+        // count; only projects without one need their directory scanned.
+        let session_count = if index_count > 0 {
+            index_count
+        } else {
+            fs::read_dir(&dir_path)
+                .map(|rd| {
+                    rd.filter_map(|e| e.ok())
+                        .filter(|e| is_session_file_name(&e.file_name()))
+                        .count()
+                })
+                .unwrap_or(0)
+        };
 
         projects.push(ProjectInfo {
             dir_name,
@@ -247,24 +651,106 @@ pub fn list_sessions(project_name: &str) -> Result<Vec<SessionInfo>> {
         Some(d) => d,
         None => return Ok(Vec::new()),
     };
-    list_sessions_in(project_name, &projects_dir)
+    list_sessions_in(project_name, &projects_dir, summary_cache_dir().as_deref())
 }
 
-pub(crate) fn list_sessions_in(project_name: &str, projects_dir: &Path) -> Result<Vec<SessionInfo>> {
+/// `summary_cache_dir`, when given, holds a `<project_name>.json` cache of
+/// per-file summaries so unchanged transcripts are not re-read.
+pub(crate) fn list_sessions_in(
+    project_name: &str,
+    projects_dir: &Path,
+    summary_cache_dir: Option<&Path>,
+) -> Result<Vec<SessionInfo>> {
+    // Both readers treat a missing file or directory as empty, so no
+    // separate exists() checks are needed.
     let project_dir = projects_dir.join(project_name);
-    if !project_dir.exists() {
-        return Ok(Vec::new());
+    let index_path = project_dir.join("sessions-index.json");
+    let sessions = list_sessions_from_index(project_name, &index_path);
+    if !sessions.is_empty() {
+        return Ok(sessions);
     }
 
-    let index_path = project_dir.join("sessions-index.json");
-    if index_path.exists() {
-        let sessions = list_sessions_from_index(project_name, &index_path);
-        if !sessions.is_empty() {
-            return Ok(sessions);
+    let cache_path = summary_cache_dir.map(|d| d.join(format!("{}.json", project_name)));
+    Ok(list_sessions_from_files(
+        project_name,
+        &project_dir,
+        cache_path.as_deref(),
+    ))
+}
+
+/// Cheap fingerprint of a project directory's session files.
+///
+/// Computed from directory metadata only; any change that could alter the
+/// result of `list_sessions` (a new, removed, or appended transcript, or a
+/// rewritten sessions-index.json) changes the stamp.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct ProjectStamp {
+    dir_mtime: Option<SystemTime>,
+    index_mtime: Option<SystemTime>,
+    session_files: usize,
+    session_bytes: u64,
+    newest_session_mtime: Option<SystemTime>,
+}
+
+/// Stamp of a project under ~/.claude/projects; `None` if it cannot be read.
+pub fn project_stamp(project_name: &str) -> Option<ProjectStamp> {
+    project_stamp_in(project_name, &claude_projects_dir()?)
+}
+
+pub(crate) fn project_stamp_in(project_name: &str, projects_dir: &Path) -> Option<ProjectStamp> {
+    let project_dir = projects_dir.join(project_name);
+    let dir_mtime = fs::metadata(&project_dir).ok()?.modified().ok();
+    let index_mtime = fs::metadata(project_dir.join("sessions-index.json"))
+        .and_then(|m| m.modified())
+        .ok();
+
+    let mut stamp = ProjectStamp {
+        dir_mtime,
+        index_mtime,
+        session_files: 0,
+        session_bytes: 0,
+        newest_session_mtime: None,
+    };
+    for entry in fs::read_dir(&project_dir).ok()?.filter_map(|e| e.ok()) {
+        if !is_session_file_name(&entry.file_name()) {
+            continue;
+        }
+        let Ok(meta) = entry.metadata() else { continue };
+        stamp.session_files += 1;
+        stamp.session_bytes += meta.len();
+        stamp.newest_session_mtime = stamp.newest_session_mtime.max(meta.modified().ok());
+    }
+    Some(stamp)
+}
+
+/// Session lists already read this run, reused while a project's stamp is unchanged.
+#[derive(Default)]
+pub struct SessionListCache {
+    entries: HashMap<String, (ProjectStamp, Vec<SessionInfo>)>,
+}
+
+impl SessionListCache {
+    /// The cached list for `project_name`, if it was read at `stamp`.
+    pub fn get(&self, project_name: &str, stamp: &ProjectStamp) -> Option<Vec<SessionInfo>> {
+        match self.entries.get(project_name) {
+            Some((cached_stamp, sessions)) if cached_stamp == stamp => Some(sessions.clone()),
+            _ => None,
         }
     }
 
-    Ok(list_sessions_from_files(project_name, &project_dir))
+    /// Remember `sessions` as the list read for `project_name` at `stamp`.
+    /// Without a stamp nothing can be validated later, so any entry is dropped.
+    pub fn insert(&mut self, project_name: &str, stamp: Option<ProjectStamp>, sessions: &[SessionInfo]) {
+        match stamp {
+            Some(stamp) => {
+                self.entries
+                    .insert(project_name.to_string(), (stamp, sessions.to_vec()));
+            }
+            None => {
+                self.entries.remove(project_name);
+            }
+        }
+    }
 }
 
 /// Parse a single entry from sessions-index.json into a SessionInfo.
@@ -308,111 +794,248 @@ pub(crate) fn parse_index_entry(entry: &Value, project_name: &str) -> SessionInf
     }
 }
 
+/// Sort by timestamp descending (newest first), sessions without one last.
+///
+/// `Option<DateTime>` already orders `None` before any time, so the reversed
+/// timestamp is the key itself; no sentinel is built per comparison.
+fn sort_newest_first(sessions: &mut [SessionInfo]) {
+    sessions.sort_by_key(|s| Reverse(s.timestamp));
+}
+
 fn list_sessions_from_index(project_name: &str, index_path: &Path) -> Vec<SessionInfo> {
     let content = match fs::read_to_string(index_path) {
         Ok(c) => c,
         Err(_) => return Vec::new(),
     };
-    let data: Value = match serde_json::from_str(&content) {
-        Ok(v) => v,
+    #[derive(Deserialize)]
+    struct RawIndexEntries {
+        #[serde(default)]
+        entries: Vec<Value>,
+    }
+    let entries = match serde_json::from_str::<RawIndexEntries>(&content) {
+        Ok(data) => data.entries,
         Err(_) => return Vec::new(),
     };
 
-    let entries = match data.get("entries").and_then(Value::as_array) {
-        Some(arr) => arr,
-        None => return Vec::new(),
-    };
-
     let mut sessions: Vec<SessionInfo> = entries
         .iter()
         .map(|entry| parse_index_entry(entry, project_name))
         .collect();
 
-    // Sort by timestamp descending (newest first)
-    sessions.sort_by(|a, b| {
-        let ta = a.timestamp.unwrap_or(DateTime::<Utc>::MIN_UTC);
-        let tb = b.timestamp.unwrap_or(DateTime::<Utc>::MIN_UTC);
-        tb.cmp(&ta)
-    });
+    sort_newest_first(&mut sessions);
 
     sessions
 }
 
-fn list_sessions_from_files(project_name: &str, project_dir: &Path) -> Vec<SessionInfo> {
-    let mut sessions = Vec::new();
+/// Summary of one transcript as stored in the on-disk summary cache, valid
+/// while the file's size and mtime are unchanged.
+#[derive(Debug, Clone, Serialize, Deserialize)]
+struct CachedSummary {
+    size: u64,
+    mtime: SystemTime,
+    preview: String,
+    timestamp: Option<DateTime<Utc>>,
+    message_count: usize,
+    git_branch: String,
+}
 
+impl CachedSummary {
+    fn to_session_info(&self, session_id: String, project_name: &str) -> SessionInfo {
+        SessionInfo {
+            session_id,
+            project_name: project_name.to_string(),
+            preview: self.preview.clone(),
+            timestamp: self.timestamp,
+            message_count: self.message_count,
+            git_branch: self.git_branch.clone(),
+            summary: String::new(),
+        }
+    }
+}
+
+/// Cached summaries keyed by session id.
+type SummaryCache = HashMap<String, CachedSummary>;
+
+fn read_summary_cache(path: &Path) -> SummaryCache {
+    fs::read(path)
+        .ok()
+        .and_then(|bytes| serde_json::from_slice(&bytes).ok())
+        .unwrap_or_default()
+}
+
+/// Write the cache through a temporary file renamed into place, so readers
+/// and concurrent writers (a list load abandoned by `go_back` may still be
+/// running) only ever see a complete file.
+fn write_summary_cache(path: &Path, cache: &SummaryCache) -> Result<()> {
+    static WRITES: AtomicUsize = AtomicUsize::new(0);
+
+    if let Some(parent) = path.parent() {
+        fs::create_dir_all(parent)?;
+    }
+    let mut tmp_name = path.file_name().unwrap_or_default().to_os_string();
+    tmp_name.push(format!(
+        ".{}.{}.tmp",
+        std::process::id(),
+        WRITES.fetch_add(1, Ordering::Relaxed)
+    ));
+    let tmp_path = path.with_file_name(tmp_name);
+
+    let written = fs::write(&tmp_path, serde_json::to_vec(cache)?)
+        .and_then(|()| fs::rename(&tmp_path, path));
+    if written.is_err() {
+        let _ = fs::remove_file(&tmp_path);
+    }
+    Ok(written?)
+}
+
+fn list_sessions_from_files(
+    project_name: &str,
+    project_dir: &Path,
+    cache_path: Option<&Path>,
+) -> Vec<SessionInfo> {
     let entries = match fs::read_dir(project_dir) {
         Ok(rd) => rd,
-        Err(_) => return sessions,
+        Err(_) => return Vec::new(),
     };
 
-    for entry in entries.filter_map(|e| e.ok()) {
-        let path = entry.path();
-        if path.extension().map(|e| e == "jsonl").unwrap_or(false) {
-            let session_id = path
+    let files: Vec<(String, PathBuf, Option<(u64, SystemTime)>)> = entries
+        .filter_map(|e| e.ok())
+        .filter_map(|entry| {
+            let file_name = entry.file_name();
+            if !is_session_file_name(&file_name) {
+                return None;
+            }
+            let session_id = Path::new(&file_name)
                 .file_stem()
                 .map(|s| s.to_string_lossy().to_string())
                 .unwrap_or_default();
+            let stat = entry
+                .metadata()
+                .ok()
+                .and_then(|m| Some((m.len(), m.modified().ok()?)));
+            Some((session_id, entry.path(), stat))
+        })
+        .collect();
 
-            let mut preview = String::new();
-            let mut timestamp: Option<DateTime<Utc>> = None;
-            let mut git_branch = String::new();
-            let mut message_count: usize = 0;
+    let old_cache = cache_path.map(read_summary_cache).unwrap_or_default();
+    let mut new_cache = SummaryCache::with_capacity(files.len());
+    let mut sessions = Vec::with_capacity(files.len());
+    let mut stale = Vec::new();
+    for (session_id, path, stat) in files {
+        match (old_cache.get(&session_id), stat) {
+            (Some(cached), Some((size, mtime))) if cached.size == size && cached.mtime == mtime => {
+                sessions.push(cached.to_session_info(session_id.clone(), project_name));
+                new_cache.insert(session_id, cached.clone());
+            }
+            _ => stale.push((session_id, path, stat)),
+        }
+    }
 
-            if let Ok(content) = fs::read_to_string(&path) {
-                for line in content.lines() {
-                    let line = line.trim();
-                    if line.is_empty() {
-                        continue;
-                    }
-                    let obj: Value = match serde_json::from_str(line) {
-                        Ok(v) => v,
-                        Err(_) => continue,
-                    };
-
-                    let msg_type = obj.get("type").and_then(Value::as_str).unwrap_or("");
-                    if msg_type == "user" || msg_type == "assistant" {
-                        message_count += 1;
-                    }
+    // Each transcript is read and parsed independently, so spread them
+    // across rayon's thread pool.
+    let parsed: Vec<(SessionInfo, Option<(u64, SystemTime)>)> = stale
+        .into_par_iter()
+        .map(|(session_id, path, stat)| {
+            (summarize_session_file(session_id, &path, project_name), stat)
+        })
+        .collect();
 
-                    if msg_type == "user" && preview.is_empty() {
-                        let msg_content = obj
-                            .get("message")
-                            .and_then(|m| m.get("content"))
-                            .cloned()
-                            .unwrap_or(Value::String(String::new()));
-                        preview = truncate_str(&extract_text_from_content(&msg_content), 200);
-                        timestamp =
-                            parse_timestamp(obj.get("timestamp").and_then(Value::as_str));
-                        git_branch = obj
-                            .get("gitBranch")
-                            .and_then(Value::as_str)
-                            .unwrap_or("")
-                            .to_string();
+    let cache_changed = !parsed.is_empty() || new_cache.len() != old_cache.len();
+    for (session, stat) in parsed {
+        if let Some((size, mtime)) = stat {
+            new_cache.insert(
+                session.session_id.clone(),
+                CachedSummary {
+                    size,
+                    mtime,
+                    preview: session.preview.clone(),
+                    timestamp: session.timestamp,
+                    message_count: session.message_count,
+                    git_branch: session.git_branch.clone(),
+                },
+            );
+        }
+        sessions.push(session);
+    }
+
+    // The cache only saves work on the next run; failing to write it is harmless.
+    if let Some(path) = cache_path.filter(|_| cache_changed) {
+        let _ = write_summary_cache(path, &new_cache);
+    }
+
+    sort_newest_first(&mut sessions);
+
+    sessions
+}
+
+/// Build a SessionInfo from a transcript: preview, timestamp and branch of the
+/// first user message, plus the user/assistant message count.
+fn summarize_session_file(session_id: String, path: &Path, project_name: &str) -> SessionInfo {
+    let mut preview = String::new();
+    let mut timestamp: Option<DateTime<Utc>> = None;
+    let mut git_branch = String::new();
+    let mut message_count: usize = 0;
+
+    // An unreadable file is summarized from whatever lines were read.
+    let _ = for_each_jsonl_line(path, |line| {
+        // Classify each line by its type alone; only user lines are
+        // read further, and only until a preview has been found.
+        let kind = match serde_json::from_slice::<RawLineType>(line) {
+            Ok(raw) => raw.kind,
+            Err(_) => return,
+        };
+        match kind {
+            Some(LineKind::User) => {
+                message_count += 1;
+                if preview.is_empty() {
+                    if let Some(found) = preview_from_user_line(line) {
+                        (preview, timestamp, git_branch) = found;
                     }
                 }
             }
-
-            sessions.push(SessionInfo {
-                session_id,
-                project_name: project_name.to_string(),
-                preview,
-                timestamp,
-                message_count,
-                git_branch,
-                summary: String::new(),
-            });
+            Some(LineKind::Assistant) => message_count += 1,
+            _ => {}
         }
+    });
+
+    SessionInfo {
+        session_id,
+        project_name: project_name.to_string(),
+        preview,
+        timestamp,
+        message_count,
+        git_branch,
+        summary: String::new(),
     }
+}
 
-    // Sort by timestamp descending
-    sessions.sort_by(|a, b| {
-        let ta = a.timestamp.unwrap_or(DateTime::<Utc>::MIN_UTC);
-        let tb = b.timestamp.unwrap_or(DateTime::<Utc>::MIN_UTC);
-        tb.cmp(&ta)
-    });
+/// Stream the messages of a session JSONL file in order, parsing each line
+/// as it is read. A missing file yields no messages.
+pub fn iter_session(project_name: &str, session_id: &str) -> Result<SessionMessages> {
+    let projects_dir = match claude_projects_dir() {
+        Some(d) => d,
+        None => return Ok(SessionMessages::default()),
+    };
+    iter_session_in(project_name, session_id, &projects_dir)
+}
 
-    sessions
+pub(crate) fn iter_session_in(
+    project_name: &str,
+    session_id: &str,
+    projects_dir: &Path,
+) -> Result<SessionMessages> {
+    let jsonl_path = projects_dir
+        .join(project_name)
+        .join(format!("{}.jsonl", session_id));
+
+    match JsonlLines::open(&jsonl_path) {
+        Ok(lines) => Ok(SessionMessages {
+            lines: Some(lines),
+            pending: Vec::new(),
+        }),
+        Err(e) if e.kind() == io::ErrorKind::NotFound => Ok(SessionMessages::default()),
+        Err(e) => Err(e.into()),
+    }
 }
 
 /// Load all messages from a session JSONL file.
@@ -425,176 +1048,293 @@ pub fn load_session(project_name: &str, session_id: &str) -> Result<Vec<Message>
 }
 
 pub(crate) fn load_session_in(project_name: &str, session_id: &str, projects_dir: &Path) -> Result<Vec<Message>> {
-    let jsonl_path = projects_dir
-        .join(project_name)
-        .join(format!("{}.jsonl", session_id));
+    let messages = iter_session_in(project_name, session_id, projects_dir)?;
+    Ok(messages.collect::<io::Result<_>>()?)
+}
+
+/// Messages of a session, read from its transcript on demand; see `iter_session`.
+///
+/// Yields an error once if reading the file fails, and nothing after it.
+#[derive(Default)]
+pub struct SessionMessages {
+    lines: Option<JsonlLines>,
+    /// Messages of the last line read, in reverse so `pop` yields them in order.
+    pending: Vec<Message>,
+}
+
+impl Iterator for SessionMessages {
+    type Item = io::Result<Message>;
+
+    fn next(&mut self) -> Option<Self::Item> {
+        loop {
+            if let Some(message) = self.pending.pop() {
+                return Some(Ok(message));
+            }
+            match self.lines.as_mut()?.next_line() {
+                Ok(Some(line)) => {
+                    parse_jsonl_line_into(line, &mut self.pending);
+                    self.pending.reverse();
+                }
+                Ok(None) => {
+                    self.lines = None;
+                    return None;
+                }
+                Err(e) => {
+                    self.lines = None;
+                    return Some(Err(e));
+                }
+            }
+        }
+    }
+}
+
+/// The non-blank lines of a JSONL file as raw bytes, read into one reused buffer.
+///
+/// Lines go to serde_json undecoded: it checks UTF-8 only in the strings it
+/// actually reads, so the file never takes a separate decoding pass, and one
+/// bad line cannot make the whole file unreadable.
+struct JsonlLines {
+    reader: BufReader<File>,
+    line: Vec<u8>,
+}
+
+impl JsonlLines {
+    fn open(path: &Path) -> io::Result<Self> {
+        Ok(JsonlLines {
+            reader: BufReader::new(File::open(path)?),
+            line: Vec::new(),
+        })
+    }
 
-    if !jsonl_path.exists() {
-        return Ok(Vec::new());
+    /// The next non-blank line, trimmed, or `None` at the end of the file.
+    fn next_line(&mut self) -> io::Result<Option<&[u8]>> {
+        loop {
+            self.line.clear();
+            if self.reader.read_until(b'\n', &mut self.line)? == 0 {
+                return Ok(None);
+            }
+            if !self.line.trim_ascii().is_empty() {
+                return Ok(Some(self.line.trim_ascii()));
+            }
+        }
     }
+}
 
-    let content = fs::read_to_string(&jsonl_path)?;
-    Ok(content.lines().flat_map(parse_jsonl_line).collect())
+/// Call `f` with each non-blank line of a JSONL file, as raw bytes.
+pub(crate) fn for_each_jsonl_line(path: &Path, mut f: impl FnMut(&[u8])) -> io::Result<()> {
+    let mut lines = JsonlLines::open(path)?;
+    while let Some(line) = lines.next_line()? {
+        f(line);
+    }
+    Ok(())
 }
 
 /// Parse a single JSONL line into zero or more Messages.
 ///
 /// Returns an empty Vec for blank lines, parse errors, or unknown message types.
-pub(crate) fn parse_jsonl_line(line: &str) -> Vec<Message> {
-    let line = line.trim();
+#[cfg(test)]
+pub(crate) fn parse_jsonl_line(line: impl AsRef<[u8]>) -> Vec<Message> {
+    let mut messages = Vec::new();
+    parse_jsonl_line_into(line.as_ref(), &mut messages);
+    messages
+}
+
+/// Parse a single JSONL line, appending its Messages to `out`.
+///
+/// Blank lines, parse errors, and unknown message types append nothing.
+pub(crate) fn parse_jsonl_line_into(line: &[u8], out: &mut Vec<Message>) {
+    let line = line.trim_ascii();
     if line.is_empty() {
-        return Vec::new();
+        return;
     }
-    let obj: Value = match serde_json::from_str(line) {
+    let raw: RawLine = match serde_json::from_slice(line) {
         Ok(v) => v,
-        Err(_) => return Vec::new(),
+        Err(_) => return,
     };
+    // Skip unknown types (e.g. "file-history-snapshot", "progress")
+    let Some(handler) = raw.kind.and_then(LineKind::handler) else {
+        return;
+    };
+    let timestamp = parse_timestamp(raw.timestamp.as_deref());
+    handler(raw, timestamp, out);
+}
 
-    let msg_type = obj.get("type").and_then(Value::as_str).unwrap_or("");
-    let timestamp = parse_timestamp(obj.get("timestamp").and_then(Value::as_str));
-
-    match msg_type {
-        "user" => {
-            let msg_content = obj
-                .get("message")
-                .and_then(|m| m.get("content"))
-                .cloned()
-                .unwrap_or(Value::String(String::new()));
-
-            let mut messages = Vec::new();
-            if msg_content.is_array() {
-                let tool_blocks = extract_tool_blocks(&msg_content);
-                if !tool_blocks.is_empty() {
-                    for block in tool_blocks {
-                        if block.get("type").and_then(Value::as_str) == Some("tool_result") {
-                            let result_content = block
-                                .get("content")
-                                .cloned()
-                                .unwrap_or(Value::String(String::new()));
-                            let result_text = if result_content.is_array() {
-                                extract_text_from_content(&result_content)
-                            } else {
-                                match &result_content {
-                                    Value::String(s) => s.clone(),
-                                    other => other.to_string(),
-                                }
-                            };
-                            messages.push(Message {
-                                role: MessageRole::ToolResult,
-                                text: result_text,
-                                timestamp,
-                                tool_name: None,
-                            });
-                        }
-                    }
-                } else {
-                    // Text-only user message with array content
-                    let text = extract_text_from_content(&msg_content);
-                    if !text.is_empty() {
-                        messages.push(Message {
-                            role: MessageRole::User,
-                            text,
-                            timestamp,
-                            tool_name: None,
-                        });
-                    }
-                }
-            } else {
-                let text = extract_text_from_content(&msg_content);
-                if !text.is_empty() {
-                    messages.push(Message {
-                        role: MessageRole::User,
-                        text,
-                        timestamp,
-                        tool_name: None,
-                    });
-                }
-            }
-            messages
+/// Appends the Messages for one transcript line of a given type.
+type LineHandler = fn(RawLine, Option<DateTime<Utc>>, &mut Vec<Message>);
+
+impl LineKind {
+    fn handler(self) -> Option<LineHandler> {
+        match self {
+            LineKind::User => Some(push_user_messages),
+            LineKind::Assistant => Some(push_assistant_messages),
+            LineKind::System => Some(push_system_message),
+            LineKind::Other => None,
         }
-        "assistant" => {
-            let msg_content = obj
-                .get("message")
-                .and_then(|m| m.get("content"))
-                .cloned()
-                .unwrap_or(Value::String(String::new()));
+    }
+}
 
-            let mut messages = Vec::new();
+fn push_user_messages(mut raw: RawLine, timestamp: Option<DateTime<Utc>>, out: &mut Vec<Message>) {
+    let text = match raw.take_content() {
+        Value::Array(blocks) => return push_user_blocks(blocks, timestamp, out),
+        other => extract_text_from_content(&other),
+    };
+    if !text.is_empty() {
+        out.push(Message {
+            role: MessageRole::User,
+            text,
+            timestamp,
+            tool_name: None,
+        });
+    }
+}
+
+fn push_assistant_messages(mut raw: RawLine, timestamp: Option<DateTime<Utc>>, out: &mut Vec<Message>) {
+    let text = match raw.take_content() {
+        Value::Array(blocks) => return push_assistant_blocks(blocks, timestamp, out),
+        other => extract_text_from_content(&other),
+    };
+    if !text.is_empty() {
+        out.push(Message {
+            role: MessageRole::Assistant,
+            text,
+            timestamp,
+            tool_name: None,
+        });
+    }
+}
+
+fn push_system_message(mut raw: RawLine, timestamp: Option<DateTime<Utc>>, out: &mut Vec<Message>) {
+    let text = match raw.take_content() {
+        Value::String(s) => s,
+        content @ (Value::Array(_) | Value::Object(_)) => extract_text_from_content(&content),
+        _ => String::new(),
+    };
+
+    let subtype = raw.subtype.as_deref().unwrap_or("");
+    let text = if text.is_empty() {
+        if subtype.is_empty() {
+            "[system]".to_string()
+        } else {
+            format!("[system: {}]", subtype)
+        }
+    } else {
+        text
+    };
 
-            // Extract text portion
-            let text = extract_text_from_content(&msg_content);
-            if !text.is_empty() {
-                messages.push(Message {
-                    role: MessageRole::Assistant,
-                    text,
+    out.push(Message {
+        role: MessageRole::System,
+        text,
+        timestamp,
+        tool_name: None,
+    });
+}
+
+/// Append a text block to `text`, newline-separated like `extract_text_from_content`.
+fn push_text_block(text: &mut String, text_blocks: &mut usize, block: &str) {
+    if *text_blocks > 0 {
+        text.push('\n');
+    }
+    text.push_str(block);
+    *text_blocks += 1;
+}
+
+/// Turn the content blocks of a `user` line into Messages in a single pass.
+///
+/// Lines carrying tool blocks yield one ToolResult per `tool_result` block;
+/// otherwise the text blocks are joined into a single User message.
+fn push_user_blocks(blocks: Vec<Value>, timestamp: Option<DateTime<Utc>>, out: &mut Vec<Message>) {
+    let mut text = String::new();
+    let mut text_blocks = 0;
+    let mut has_tool_blocks = false;
+
+    for mut block in blocks {
+        let kind = block.get("type").and_then(Value::as_str).unwrap_or("");
+        match kind {
+            "text" => {
+                if let Some(t) = block.get("text").and_then(Value::as_str) {
+                    push_text_block(&mut text, &mut text_blocks, t);
+                }
+            }
+            "tool_use" => has_tool_blocks = true,
+            "tool_result" => {
+                has_tool_blocks = true;
+                let result_text = match block.get_mut("content").map(Value::take) {
+                    None => String::new(),
+                    Some(Value::String(s)) => s,
+                    Some(content @ Value::Array(_)) => extract_text_from_content(&content),
+                    Some(other) => other.to_string(),
+                };
+                out.push(Message {
+                    role: MessageRole::ToolResult,
+                    text: result_text,
                     timestamp,
                     tool_name: None,
                 });
             }
+            _ => {}
+        }
+    }
 
-            // Extract tool_use blocks as separate messages
-            if let Value::Array(arr) = &msg_content {
-                for block in arr {
-                    if block.get("type").and_then(Value::as_str) == Some("tool_use") {
-                        let tool_name = block
-                            .get("name")
-                            .and_then(Value::as_str)
-                            .unwrap_or("")
-                            .to_string();
-                        let tool_input = block
-                            .get("input")
-                            .cloned()
-                            .unwrap_or(Value::Object(serde_json::Map::new()));
-                        let summary = summarize_tool_use(&tool_name, &tool_input);
-                        messages.push(Message {
-                            role: MessageRole::ToolUse,
-                            text: summary,
-                            timestamp,
-                            tool_name: Some(tool_name),
-                        });
-                    }
+    if !has_tool_blocks && !text.is_empty() {
+        out.push(Message {
+            role: MessageRole::User,
+            text,
+            timestamp,
+            tool_name: None,
+        });
+    }
+}
+
+/// Turn the content blocks of an `assistant` line into Messages in a single pass:
+/// the joined text first, followed by one ToolUse per `tool_use` block.
+fn push_assistant_blocks(blocks: Vec<Value>, timestamp: Option<DateTime<Utc>>, out: &mut Vec<Message>) {
+    let mut text = String::new();
+    let mut text_blocks = 0;
+    let text_at = out.len();
+
+    for mut block in blocks {
+        let kind = block.get("type").and_then(Value::as_str).unwrap_or("");
+        match kind {
+            "text" => {
+                if let Some(t) = block.get("text").and_then(Value::as_str) {
+                    push_text_block(&mut text, &mut text_blocks, t);
                 }
             }
-            messages
+            "tool_use" => {
+                // The name was already allocated while parsing the line;
+                // move it out rather than copying it.
+                let tool_name = match block.get_mut("name").map(Value::take) {
+                    Some(Value::String(name)) => name,
+                    _ => String::new(),
+                };
+                let tool_input = block
+                    .get_mut("input")
+                    .map(Value::take)
+                    .unwrap_or(Value::Object(serde_json::Map::new()));
+                let summary = summarize_tool_use(&tool_name, &tool_input);
+                out.push(Message {
+                    role: MessageRole::ToolUse,
+                    text: summary,
+                    timestamp,
+                    tool_name: Some(tool_name),
+                });
+            }
+            _ => {}
         }
-        "system" => {
-            let subtype = obj
-                .get("subtype")
-                .and_then(Value::as_str)
-                .unwrap_or("");
-            let raw_content = obj
-                .get("message")
-                .and_then(|m| m.get("content"))
-                .cloned()
-                .unwrap_or(Value::Null);
-
-            let text = match &raw_content {
-                Value::String(s) => s.clone(),
-                Value::Array(_) | Value::Object(_) => extract_text_from_content(&raw_content),
-                _ => String::new(),
-            };
-
-            let text = if text.is_empty() {
-                if subtype.is_empty() {
-                    "[system]".to_string()
-                } else {
-                    format!("[system: {}]", subtype)
-                }
-            } else {
-                text
-            };
+    }
 
-            vec![Message {
-                role: MessageRole::System,
+    // The text goes ahead of this line's tool uses, which are the only
+    // messages after `text_at`.
+    if !text.is_empty() {
+        out.insert(
+            text_at,
+            Message {
+                role: MessageRole::Assistant,
                 text,
                 timestamp,
                 tool_name: None,
-            }]
-        }
-        _ => {
-            // Skip unknown types (e.g. "file-history-snapshot", "progress")
-            Vec::new()
-        }
+            },
+        );
     }
 }
 
@@ -625,6 +1365,20 @@ mod tests {
         assert_eq!(truncate_str("hello world", 5), "hello...");
     }
 
+    #[test]
+    fn truncate_joined_matches_truncated_join() {
+        let parts = ["ab", "", "こんにちは", "xyz"];
+        for max in 0..16 {
+            assert_eq!(
+                truncate_joined(parts, max),
+                truncate_str(&parts.join("\n"), max),
+                "max = {}",
+                max
+            );
+        }
+        assert_eq!(truncate_joined(std::iter::empty(), 5), "");
+    }
+
     #[test]
     fn truncate_str_multibyte() {
         // 3 chars, limit 2 -> "ab..."  equivalent with Japanese
@@ -653,6 +1407,21 @@ mod tests {
         assert_eq!(result, "/Users/foo/src/gitlab.com/org/repo");
     }
 
+    #[test]
+    fn decode_project_path_domain_at_end() {
+        let input = "-Users-foo-src-tech-pepabo-com";
+        let result = decode_project_path(input);
+        assert_eq!(result, "/Users/foo/src/tech.pepabo.com");
+    }
+
+    #[test]
+    fn decode_project_path_domain_prefix_of_segment() {
+        // "github-company" is not the github.com domain
+        let input = "-Users-foo-github-company-repo";
+        let result = decode_project_path(input);
+        assert_eq!(result, "/Users/foo/github/company/repo");
+    }
+
     #[test]
     fn decode_project_path_empty() {
         assert_eq!(decode_project_path(""), "");
@@ -670,6 +1439,34 @@ mod tests {
         assert_eq!(dt.format("%Y-%m-%d").to_string(), "2024-01-15");
     }
 
+    #[test]
+    fn parse_timestamp_fast_path_matches_chrono() {
+        let cases = [
+            "2024-01-15T10:30:00Z",
+            "2024-01-15T10:30:00.5Z",
+            "2026-01-15T10:00:00.123Z",
+            "2026-01-15T10:00:00.123456789Z",
+            "2026-01-15T10:00:00.1234567891Z",
+            "2024-02-29T23:59:59Z",
+            "2023-02-29T00:00:00Z",
+            "2024-13-01T00:00:00Z",
+            "2024-01-15T24:00:00Z",
+            "2016-12-31T23:59:60Z",
+            "2024-01-15T10:30:00+09:00",
+            "2024-01-15 10:30:00Z",
+            "2024-01-15T10:30:00.Z",
+            "2024-01-15T1a:30:00Z",
+        ];
+        for ts in cases {
+            let fast = parse_utc_timestamp_fast(ts);
+            if fast.is_some() {
+                assert_eq!(fast, ts.parse::<DateTime<Utc>>().ok(), "{}", ts);
+            }
+            assert_eq!(parse_timestamp(Some(ts)), ts.parse::<DateTime<Utc>>().ok(), "{}", ts);
+        }
+        assert!(parse_utc_timestamp_fast("2026-01-15T10:00:00.123Z").is_some());
+    }
+
     #[test]
     fn parse_timestamp_none() {
         assert!(parse_timestamp(None).is_none());
@@ -706,30 +1503,17 @@ mod tests {
     }
 
     #[test]
-    fn extract_text_from_content_null() {
-        let v = json!(null);
+    fn extract_text_from_content_single_block() {
+        let v = json!([{"type": "text", "text": "only"}]);
+        assert_eq!(extract_text_from_content(&v), "only");
+        let v = json!([{"type": "tool_use", "name": "Bash"}]);
         assert_eq!(extract_text_from_content(&v), "");
     }
 
-    // ================================================================
-    // extract_tool_blocks
-    // ================================================================
-
-    #[test]
-    fn extract_tool_blocks_mixed() {
-        let v = json!([
-            {"type": "text", "text": "hello"},
-            {"type": "tool_use", "name": "Bash"},
-            {"type": "tool_result", "content": "ok"}
-        ]);
-        let blocks = extract_tool_blocks(&v);
-        assert_eq!(blocks.len(), 2);
-    }
-
     #[test]
-    fn extract_tool_blocks_non_array() {
-        let v = json!("hello");
-        assert!(extract_tool_blocks(&v).is_empty());
+    fn extract_text_from_content_null() {
+        let v = json!(null);
+        assert_eq!(extract_text_from_content(&v), "");
     }
 
     // ================================================================
@@ -793,6 +1577,26 @@ mod tests {
         assert!(msgs[1].text.contains("[Read]"));
     }
 
+    #[test]
+    fn parse_jsonl_line_user_tool_results() {
+        let line = r#"{"type":"user","message":{"content":[{"type":"text","text":"ignored"},{"type":"tool_result","content":[{"type":"text","text":"a"},{"type":"text","text":"b"}]},{"type":"tool_result","content":"ok"},{"type":"tool_result"}]}}"#;
+        let msgs = parse_jsonl_line(line);
+        assert_eq!(msgs.len(), 3);
+        assert!(msgs.iter().all(|m| m.role == MessageRole::ToolResult));
+        assert_eq!(msgs[0].text, "a\nb");
+        assert_eq!(msgs[1].text, "ok");
+        assert_eq!(msgs[2].text, "");
+    }
+
+    #[test]
+    fn parse_jsonl_line_user_text_blocks() {
+        let line = r#"{"type":"user","message":{"content":[{"type":"text","text":"one"},{"type":"image"},{"type":"text","text":"two"}]}}"#;
+        let msgs = parse_jsonl_line(line);
+        assert_eq!(msgs.len(), 1);
+        assert_eq!(msgs[0].role, MessageRole::User);
+        assert_eq!(msgs[0].text, "one\ntwo");
+    }
+
     #[test]
     fn parse_jsonl_line_system() {
         let line = r#"{"type":"system","subtype":"init","message":{"content":"System started"}}"#;
@@ -802,6 +1606,50 @@ mod tests {
         assert_eq!(msgs[0].text, "System started");
     }
 
+    #[test]
+    fn parse_jsonl_line_ignores_unrelated_fields() {
+        let line = r#"{"parentUuid":null,"type":"user","toolUseResult":{"stdout":"x","nested":[1,2,{"a":"b"}]},"timestamp":"2024-01-15T10:30:00Z","message":{"role":"user","content":"hello"}}"#;
+        let msgs = parse_jsonl_line(line);
+        assert_eq!(msgs.len(), 1);
+        assert_eq!(msgs[0].text, "hello");
+        assert!(msgs[0].timestamp.is_some());
+    }
+
+    #[test]
+    fn parse_jsonl_line_tolerates_mistyped_optional_fields() {
+        for line in [
+            r#"{"type":"user","timestamp":123,"message":{"content":"hello"}}"#,
+            r#"{"type":"user","gitBranch":7,"message":{"content":"hello"}}"#,
+            r#"{"type":"system","subtype":5,"message":{"content":"hello"}}"#,
+        ] {
+            let msgs = parse_jsonl_line(line);
+            assert_eq!(msgs.len(), 1, "{}", line);
+            assert_eq!(msgs[0].text, "hello");
+            assert!(msgs[0].timestamp.is_none());
+        }
+
+        let msgs = parse_jsonl_line(r#"{"type":"system","subtype":"init","message":"str"}"#);
+        assert_eq!(msgs.len(), 1);
+        assert_eq!(msgs[0].text, "[system: init]");
+    }
+
+    #[test]
+    fn parse_jsonl_line_into_appends_in_order() {
+        let mut msgs = Vec::new();
+        parse_jsonl_line_into(br#"{"type":"user","message":{"content":"q"}}"#, &mut msgs);
+        parse_jsonl_line_into(br#"{"type":"progress","data":{}}"#, &mut msgs);
+        parse_jsonl_line_into(
+            br#"{"type":"assistant","message":{"content":[{"type":"tool_use","name":"Bash","input":{"command":"ls"}},{"type":"text","text":"a"}]}}"#,
+            &mut msgs,
+        );
+        let roles: Vec<_> = msgs.iter().map(|m| m.role.clone()).collect();
+        assert_eq!(
+            roles,
+            [MessageRole::User, MessageRole::Assistant, MessageRole::ToolUse]
+        );
+        assert_eq!(msgs[1].text, "a");
+    }
+
     #[test]
     fn parse_jsonl_line_empty() {
         assert!(parse_jsonl_line("").is_empty());
@@ -880,6 +1728,81 @@ mod tests {
         assert_eq!(result[0].session_count, 1);
     }
 
+    #[test]
+    fn list_projects_in_uses_index_original_path() {
+        let tmp = TempDir::new().unwrap();
+        let project_dir = tmp.path().join("-Users-foo-my-app");
+        fs::create_dir(&project_dir).unwrap();
+        let index = json!({
+            "originalPath": "/Users/foo/my.app",
+            "entries": [{"sessionId": "s1", "projectPath": "/ignored"}]
+        });
+        fs::write(
+            project_dir.join("sessions-index.json"),
+            serde_json::to_string(&index).unwrap(),
+        )
+        .unwrap();
+
+        let result = list_projects_in(tmp.path()).unwrap();
+        assert_eq!(result[0].original_path, "/Users/foo/my.app");
+        assert_eq!(result[0].session_count, 1);
+    }
+
+    #[test]
+    fn list_projects_in_reads_original_path_despite_odd_entries() {
+        for entries in ["null", "[null]", r#"[{"projectPath": 1}]"#] {
+            let tmp = TempDir::new().unwrap();
+            let project_dir = tmp.path().join("-Users-foo-my-app");
+            fs::create_dir(&project_dir).unwrap();
+            fs::write(
+                project_dir.join("sessions-index.json"),
+                format!(r#"{{"originalPath": "/Users/foo/my.app", "entries": {}}}"#, entries),
+            )
+            .unwrap();
+
+            let result = list_projects_in(tmp.path()).unwrap();
+            assert_eq!(result[0].original_path, "/Users/foo/my.app", "{}", entries);
+        }
+    }
+
+    #[test]
+    fn list_projects_in_uses_first_entry_project_path() {
+        let tmp = TempDir::new().unwrap();
+        let project_dir = tmp.path().join("-Users-foo-my-app");
+        fs::create_dir(&project_dir).unwrap();
+        let index = json!({
+            "originalPath": 5,
+            "entries": [{"projectPath": "/Users/foo/my.app"}, {"projectPath": "/other"}, null]
+        });
+        fs::write(
+            project_dir.join("sessions-index.json"),
+            serde_json::to_string(&index).unwrap(),
+        )
+        .unwrap();
+
+        let result = list_projects_in(tmp.path()).unwrap();
+        assert_eq!(result[0].original_path, "/Users/foo/my.app");
+        assert_eq!(result[0].session_count, 3);
+    }
+
+    #[test]
+    fn list_projects_in_counts_files_when_index_is_empty() {
+        let tmp = TempDir::new().unwrap();
+        let project_dir = tmp.path().join("-Users-foo-my-app");
+        fs::create_dir(&project_dir).unwrap();
+        fs::write(
+            project_dir.join("sessions-index.json"),
+            r#"{"originalPath": "/Users/foo/my.app", "entries": []}"#,
+        )
+        .unwrap();
+        fs::write(project_dir.join("s1.jsonl"), "").unwrap();
+        fs::write(project_dir.join("s2.jsonl"), "").unwrap();
+
+        let result = list_projects_in(tmp.path()).unwrap();
+        assert_eq!(result[0].original_path, "/Users/foo/my.app");
+        assert_eq!(result[0].session_count, 2);
+    }
+
     #[test]
     fn list_projects_in_nonexistent_dir() {
         let tmp = TempDir::new().unwrap();
@@ -898,13 +1821,159 @@ mod tests {
 {"type":"assistant","timestamp":"2024-01-15T10:31:00Z","message":{"content":"hi there"}}"#;
         fs::write(project_dir.join("session-abc.jsonl"), jsonl_content).unwrap();
 
-        let result = list_sessions_in("my-project", tmp.path()).unwrap();
+        let result = list_sessions_in("my-project", tmp.path(), None).unwrap();
         assert_eq!(result.len(), 1);
         assert_eq!(result[0].session_id, "session-abc");
         assert_eq!(result[0].message_count, 2);
         assert_eq!(result[0].preview, "hello");
     }
 
+    #[test]
+    fn list_sessions_in_counts_messages_after_preview() {
+        let tmp = TempDir::new().unwrap();
+        let project_dir = tmp.path().join("my-project");
+        fs::create_dir(&project_dir).unwrap();
+
+        let jsonl_content = r#"{"type":"summary","summary":"s"}
+{"type":"user","timestamp":"2024-01-15T10:30:00Z","gitBranch":"main","message":{"content":"hello"}}
+{"type":"assistant","message":{"content":[{"type":"text","text":"hi"}]}}
+{"type":"progress","data":{"message":{"type":"assistant"}}}
+{"type":"user","message":{"content":[{"type":"tool_result","content":"ok"}]}}
+{"type":"user","message":{"content":"again"}}"#;
+        fs::write(project_dir.join("session-abc.jsonl"), jsonl_content).unwrap();
+
+        let result = list_sessions_in("my-project", tmp.path(), None).unwrap();
+        assert_eq!(result[0].preview, "hello");
+        assert_eq!(result[0].git_branch, "main");
+        assert_eq!(result[0].message_count, 4);
+    }
+
+    #[test]
+    fn preview_from_user_line_matches_full_parse() {
+        let lines = [
+            r#"{"type":"user","timestamp":"2024-01-15T10:30:00Z","gitBranch":"main","message":{"content":"say \"hi\"\nplease"}}"#,
+            r#"{"type":"user","message":{"content":[{"type":"tool_result","content":[{"type":"text","text":"x"}]},{"type":"text","text":"a"},{"type":"text","text":"b"}]}}"#,
+            r#"{"type":"user","message":{"content":["loose string",{"type":"text","text":"kept"}]}}"#,
+            r#"{"type":"user","message":{"content":{"unexpected":true}}}"#,
+            r#"{"type":"user"}"#,
+            r#"{"type":"user","timestamp":5,"gitBranch":7,"message":{"content":"typed oddly"}}"#,
+            r#"{"type":"user","message":"str"}"#,
+        ];
+        for line in lines {
+            let mut raw: RawLine = serde_json::from_str(line).unwrap();
+            let expected = truncate_str(&extract_text_from_content(&raw.take_content()), 200);
+            let (preview, timestamp, git_branch) = preview_from_user_line(line.as_bytes()).unwrap();
+            assert_eq!(preview, expected, "{}", line);
+            assert_eq!(timestamp, parse_timestamp(raw.timestamp.as_deref()));
+            assert_eq!(git_branch, raw.git_branch.unwrap_or_default());
+        }
+    }
+
+    #[test]
+    fn list_sessions_in_from_many_jsonl_files_sorted_newest_first() {
+        let tmp = TempDir::new().unwrap();
+        let project_dir = tmp.path().join("my-project");
+        fs::create_dir(&project_dir).unwrap();
+
+        for day in 10..30 {
+            let line = format!(
+                r#"{{"type":"user","timestamp":"2024-01-{}T10:30:00Z","message":{{"content":"day {}"}}}}"#,
+                day, day
+            );
+            fs::write(project_dir.join(format!("sess-{}.jsonl", day)), line).unwrap();
+        }
+
+        let result = list_sessions_in("my-project", tmp.path(), None).unwrap();
+        assert_eq!(result.len(), 20);
+        assert_eq!(result[0].session_id, "sess-29");
+        assert_eq!(result[0].preview, "day 29");
+        assert_eq!(result[19].session_id, "sess-10");
+    }
+
+    #[test]
+    fn list_sessions_in_reuses_summary_cache_until_file_changes() {
+        let tmp = TempDir::new().unwrap();
+        let project_dir = tmp.path().join("my-project");
+        fs::create_dir(&project_dir).unwrap();
+        let cache_dir = tmp.path().join("cache");
+        let jsonl_path = project_dir.join("session-abc.jsonl");
+        fs::write(
+            &jsonl_path,
+            r#"{"type":"user","timestamp":"2024-01-15T10:30:00Z","message":{"content":"hello"}}"#,
+        )
+        .unwrap();
+
+        let first = list_sessions_in("my-project", tmp.path(), Some(&cache_dir)).unwrap();
+        assert_eq!(first[0].preview, "hello");
+
+        // Doctor the cached preview: an unchanged file must be served from the cache.
+        let cache_path = cache_dir.join("my-project.json");
+        let mut cache = read_summary_cache(&cache_path);
+        cache.get_mut("session-abc").unwrap().preview = "cached".to_string();
+        write_summary_cache(&cache_path, &cache).unwrap();
+        let second = list_sessions_in("my-project", tmp.path(), Some(&cache_dir)).unwrap();
+        assert_eq!(second[0].preview, "cached");
+        assert_eq!(second[0].message_count, 1);
+
+        // Appending changes the size, so the file is summarized again.
+        let mut f = fs::OpenOptions::new().append(true).open(&jsonl_path).unwrap();
+        use std::io::Write;
+        writeln!(f).unwrap();
+        writeln!(f, r#"{{"type":"assistant","message":{{"content":"hi"}}}}"#).unwrap();
+        let third = list_sessions_in("my-project", tmp.path(), Some(&cache_dir)).unwrap();
+        assert_eq!(third[0].preview, "hello");
+        assert_eq!(third[0].message_count, 2);
+    }
+
+    #[test]
+    fn write_summary_cache_replaces_file_without_leaving_temporaries() {
+        let tmp = TempDir::new().unwrap();
+        let cache_path = tmp.path().join("cache").join("my-project.json");
+        let mut cache = SummaryCache::new();
+        for preview in ["first", "second"] {
+            cache.insert(
+                "s1".to_string(),
+                CachedSummary {
+                    size: 1,
+                    mtime: SystemTime::UNIX_EPOCH,
+                    preview: preview.to_string(),
+                    timestamp: None,
+                    message_count: 1,
+                    git_branch: String::new(),
+                },
+            );
+            write_summary_cache(&cache_path, &cache).unwrap();
+        }
+
+        assert_eq!(read_summary_cache(&cache_path)["s1"].preview, "second");
+        let files: Vec<_> = fs::read_dir(cache_path.parent().unwrap())
+            .unwrap()
+            .map(|e| e.unwrap().file_name())
+            .collect();
+        assert_eq!(files, ["my-project.json"]);
+    }
+
+    #[test]
+    fn sort_newest_first_puts_missing_timestamps_last() {
+        let session = |id: &str, ts: Option<&str>| SessionInfo {
+            session_id: id.to_string(),
+            project_name: String::new(),
+            preview: String::new(),
+            timestamp: parse_timestamp(ts),
+            message_count: 0,
+            git_branch: String::new(),
+            summary: String::new(),
+        };
+        let mut sessions = vec![
+            session("none", None),
+            session("old", Some("2024-01-01T00:00:00Z")),
+            session("new", Some("2024-02-01T00:00:00Z")),
+        ];
+        sort_newest_first(&mut sessions);
+        let ids: Vec<_> = sessions.iter().map(|s| s.session_id.as_str()).collect();
+        assert_eq!(ids, ["new", "old", "none"]);
+    }
+
     #[test]
     fn list_sessions_in_from_index() {
         let tmp = TempDir::new().unwrap();
@@ -929,13 +1998,36 @@ mod tests {
         )
         .unwrap();
 
-        let result = list_sessions_in("my-project", tmp.path()).unwrap();
+        let result = list_sessions_in("my-project", tmp.path(), None).unwrap();
         assert_eq!(result.len(), 1);
         assert_eq!(result[0].session_id, "sess-1");
         assert_eq!(result[0].preview, "First prompt");
         assert_eq!(result[0].message_count, 3);
     }
 
+    #[test]
+    fn project_stamp_changes_when_a_session_is_added() {
+        let tmp = TempDir::new().unwrap();
+        let project_dir = tmp.path().join("my-project");
+        fs::create_dir(&project_dir).unwrap();
+        fs::write(
+            project_dir.join("sess-1.jsonl"),
+            r#"{"type":"user","timestamp":"2024-01-15T10:30:00Z","message":{"content":"first"}}"#,
+        )
+        .unwrap();
+
+        let stamp = project_stamp_in("my-project", tmp.path());
+        assert!(stamp.is_some());
+        assert_eq!(stamp, project_stamp_in("my-project", tmp.path()));
+
+        fs::write(
+            project_dir.join("sess-2.jsonl"),
+            r#"{"type":"user","timestamp":"2024-01-16T10:30:00Z","message":{"content":"second"}}"#,
+        )
+        .unwrap();
+        assert_ne!(stamp, project_stamp_in("my-project", tmp.path()));
+    }
+
     #[test]
     fn load_session_in_normal() {
         let tmp = TempDir::new().unwrap();
@@ -954,6 +2046,44 @@ mod tests {
         assert_eq!(msgs[1].text, "hi there");
     }
 
+    #[test]
+    fn load_session_in_skips_lines_that_are_not_utf8() {
+        let tmp = TempDir::new().unwrap();
+        let project_dir = tmp.path().join("my-project");
+        fs::create_dir(&project_dir).unwrap();
+
+        let mut bytes = br#"{"type":"user","message":{"content":"bad "#.to_vec();
+        bytes.extend_from_slice(&[0xff, 0xfe]);
+        bytes.extend_from_slice(b"\"}}\r\n\n");
+        bytes.extend_from_slice(br#"{"type":"assistant","message":{"content":"fine"}}"#);
+        fs::write(project_dir.join("sess-1.jsonl"), bytes).unwrap();
+
+        let msgs = load_session_in("my-project", "sess-1", tmp.path()).unwrap();
+        assert_eq!(msgs.len(), 1);
+        assert_eq!(msgs[0].text, "fine");
+    }
+
+    #[test]
+    fn iter_session_in_yields_messages_as_lines_are_read() {
+        let tmp = TempDir::new().unwrap();
+        let project_dir = tmp.path().join("my-project");
+        fs::create_dir(&project_dir).unwrap();
+
+        let jsonl_content = r#"{"type":"user","message":{"content":"one"}}
+{"type":"assistant","message":{"content":[{"type":"text","text":"two"},{"type":"tool_use","name":"Read","input":{"file_path":"/a"}}]}}
+
+{"type":"user","message":{"content":"four"}}"#;
+        fs::write(project_dir.join("sess-1.jsonl"), jsonl_content).unwrap();
+
+        let mut messages = iter_session_in("my-project", "sess-1", tmp.path()).unwrap();
+        assert_eq!(messages.next().unwrap().unwrap().text, "one");
+        let rest: Vec<_> = messages.map(|m| m.unwrap().text).collect();
+        assert_eq!(rest, ["two", "[Read] /a", "four"]);
+
+        let mut missing = iter_session_in("my-project", "nonexistent", tmp.path()).unwrap();
+        assert!(missing.next().is_none());
+    }
+
     #[test]
     fn load_session_in_nonexistent_file() {
         let tmp = TempDir::new().unwrap();
@@ -3,11 +3,15 @@ use ratatui::{
     layout::{Constraint, Layout},
     style::{Color, Modifier, Style},
     text::{Line, Span},
-    widgets::{Block, Borders, Cell, Paragraph, Row, Table, Tabs, Wrap},
+    widgets::{Block, Borders, Cell, Paragraph, Row, Table, Tabs},
 };
 
 use crate::app::{App, Screen};
 use crate::models::*;
+use crate::parser::truncate_str;
+use std::borrow::Cow;
+use std::ops::Range;
+use unicode_width::UnicodeWidthChar;
 
 pub fn draw(frame: &mut Frame, app: &App) {
     let chunks = Layout::vertical([
@@ -116,6 +120,15 @@ fn draw_project_list(frame: &mut Frame, app: &App, area: ratatui::layout::Rect)
     frame.render_widget(table, area);
 }
 
+/// Breadcrumb text, followed by a loading marker while a background load runs.
+fn breadcrumb_line(text: String, app: &App) -> Line<'static> {
+    let mut spans = vec![Span::styled(text, Style::default().fg(Color::DarkGray))];
+    if app.is_loading() {
+        spans.push(Span::styled("  Loading…", Style::default().fg(Color::Yellow)));
+    }
+    Line::from(spans)
+}
+
 fn draw_session_list(frame: &mut Frame, app: &App, area: ratatui::layout::Rect) {
     let inner_chunks = Layout::vertical([
         Constraint::Length(1),
@@ -125,10 +138,10 @@ fn draw_session_list(frame: &mut Frame, app: &App, area: ratatui::layout::Rect)
     .split(area);
 
     // Breadcrumb
-    let breadcrumb = Paragraph::new(Line::from(vec![Span::styled(
+    let breadcrumb = Paragraph::new(breadcrumb_line(
         format!(" Project: {}", app.current_project_name),
-        Style::default().fg(Color::DarkGray),
-    )]));
+        app,
+    ));
     frame.render_widget(breadcrumb, inner_chunks[0]);
 
     // Filter tabs
@@ -180,13 +193,7 @@ fn draw_session_list(frame: &mut Frame, app: &App, area: ratatui::layout::Rect)
             } else {
                 Style::default().fg(Color::White)
             };
-            let preview = if session.preview.chars().count() > 80 {
-                let truncated: String = session.preview.chars().take(80).collect();
-                format!("{}...", truncated)
-            } else {
-                session.preview.clone()
-            }
-            .replace('\n', " ");
+            let preview = truncate_str(&session.preview, 80).replace('\n', " ");
             Row::new(vec![
                 Cell::from(session.timestamp_str()),
                 Cell::from(session.message_count.to_string()),
@@ -236,65 +243,201 @@ fn draw_session_detail(frame: &mut Frame, app: &App, area: ratatui::layout::Rect
         .get(app.selected_session)
         .map(|s| &s.session_id[..s.session_id.len().min(8)])
         .unwrap_or("unknown");
-    let breadcrumb = Paragraph::new(Line::from(vec![Span::styled(
+    let breadcrumb = Paragraph::new(breadcrumb_line(
         format!(" Session: {}", session_id_short),
-        Style::default().fg(Color::DarkGray),
-    )]));
+        app,
+    ));
     frame.render_widget(breadcrumb, inner_chunks[0]);
 
-    // Messages
-    let mut lines: Vec<Line> = Vec::new();
+    // Messages: only the rows under the viewport are built. Text is wrapped
+    // here rather than by Paragraph, so rows match `message_line_starts`.
+    // borders(2)
+    let visible_height = (inner_chunks[1].height as usize).saturating_sub(2);
+    let total_lines = app.message_line_starts.last().copied().unwrap_or(0);
+    let offset = app
+        .scroll_offset
+        .min(total_lines.saturating_sub(visible_height));
+    let first = app
+        .message_line_starts
+        .partition_point(|&start| start <= offset)
+        .saturating_sub(1);
+    let skip = offset - app.message_line_starts.get(first).copied().unwrap_or(0);
+
+    let lines: Vec<Line> = app
+        .messages
+        .iter()
+        .enumerate()
+        .skip(first)
+        .flat_map(|(i, msg)| {
+            let ts = match app.visible_timestamps.get(i) {
+                Some(ts) => Cow::Borrowed(ts),
+                None => Cow::Owned(msg.timestamp_str()),
+            };
+            message_lines(i, msg, ts, app.message_wrap_width())
+        })
+        .skip(skip)
+        .take(visible_height)
+        .collect();
 
-    for (i, msg) in app.messages.iter().enumerate() {
-        if i > 0 {
-            lines.push(Line::from(""));
-        }
+    let paragraph = Paragraph::new(lines).block(
+        Block::default()
+            .borders(Borders::ALL)
+            .border_style(Style::default().fg(Color::Cyan)),
+    );
 
-        let role_color = match msg.role {
-            MessageRole::User => Color::Cyan,
-            MessageRole::Assistant => Color::Green,
-            MessageRole::System => Color::Yellow,
-            MessageRole::ToolUse => Color::Yellow,
-            MessageRole::ToolResult => Color::Magenta,
-            MessageRole::Progress => Color::DarkGray,
-        };
+    frame.render_widget(paragraph, inner_chunks[1]);
+}
 
-        let ts = msg.timestamp_str();
-        let mut header_spans = vec![Span::styled(
-            msg.role_label(),
-            Style::default()
-                .fg(role_color)
-                .add_modifier(Modifier::BOLD),
-        )];
-        if !ts.is_empty() {
-            header_spans.push(Span::raw(" "));
-            header_spans.push(Span::styled(ts, Style::default().fg(Color::DarkGray)));
+/// Rows of one line of text wrapped at `width` columns, breaking after
+/// whitespace where possible and mid-word otherwise. Leading and trailing
+/// whitespace is kept, like `Wrap { trim: false }`.
+struct WrappedRows<'a> {
+    rest: Option<&'a str>,
+    width: usize,
+}
+
+fn wrapped_rows(text: &str, width: usize) -> WrappedRows<'_> {
+    WrappedRows {
+        rest: Some(text),
+        width: width.max(1),
+    }
+}
+
+impl<'a> Iterator for WrappedRows<'a> {
+    type Item = &'a str;
+
+    fn next(&mut self) -> Option<&'a str> {
+        let rest = self.rest?;
+        let mut used = 0;
+        let mut last_break = None;
+        for (i, c) in rest.char_indices() {
+            let w = c.width().unwrap_or(0);
+            // A row always takes at least one character, however wide.
+            if used + w > self.width && i > 0 {
+                let (row, tail) = rest.split_at(last_break.unwrap_or(i));
+                self.rest = Some(tail);
+                return Some(row);
+            }
+            used += w;
+            if c.is_whitespace() {
+                last_break = Some(i + c.len_utf8());
+            }
         }
-        lines.push(Line::from(header_spans));
+        self.rest = None;
+        Some(rest)
+    }
+}
 
-        let text_color = match msg.role {
-            MessageRole::ToolUse | MessageRole::ToolResult => Color::DarkGray,
-            _ => Color::White,
-        };
+/// Number of rows `message_lines` yields for the message at `index`.
+fn message_line_count(index: usize, msg: &Message, width: usize) -> usize {
+    let separator = if index > 0 { 1 } else { 0 };
+    let body: usize = msg
+        .text
+        .lines()
+        .map(|line| wrapped_rows(line, width).count())
+        .sum();
+    separator + 1 + body
+}
+
+/// Lay out up to `count` more messages at `width` columns: extend `starts`,
+/// the row offsets of already laid-out messages followed by their total
+/// (initially `[0]`).
+pub fn extend_message_layout(
+    starts: &mut Vec<usize>,
+    messages: &[Message],
+    width: usize,
+    count: usize,
+) {
+    let done = starts.len().saturating_sub(1);
+    let mut total = starts.last().copied().unwrap_or(0);
+    for (i, msg) in messages.iter().enumerate().skip(done).take(count) {
+        total += message_line_count(i, msg, width);
+        starts.push(total);
+    }
+}
 
-        for text_line in msg.text.lines() {
-            lines.push(Line::from(Span::styled(
-                text_line.to_string(),
-                Style::default().fg(text_color),
-            )));
+/// Formatted header timestamps of a run of consecutive messages, kept for
+/// the ones in view so a scroll step only formats the headers it reveals.
+#[derive(Default)]
+pub struct TimestampWindow {
+    start: usize,
+    formatted: Vec<String>,
+}
+
+impl TimestampWindow {
+    /// Cover `range` of `messages`, reusing the timestamps already formatted.
+    pub fn update(&mut self, messages: &[Message], range: Range<usize>) {
+        if range.start == self.start && range.len() == self.formatted.len() {
+            return;
         }
+        let old_start = self.start;
+        let mut old = std::mem::take(&mut self.formatted);
+        self.formatted = range
+            .clone()
+            .map(|i| match i.checked_sub(old_start).and_then(|j| old.get_mut(j)) {
+                Some(ts) => std::mem::take(ts),
+                None => messages[i].timestamp_str(),
+            })
+            .collect();
+        self.start = range.start;
     }
 
-    let paragraph = Paragraph::new(lines)
-        .scroll((app.scroll_offset as u16, 0))
-        .wrap(Wrap { trim: false })
-        .block(
-            Block::default()
-                .borders(Borders::ALL)
-                .border_style(Style::default().fg(Color::Cyan)),
-        );
+    /// Forget every entry, for when the messages themselves change.
+    pub fn clear(&mut self) {
+        self.start = 0;
+        self.formatted.clear();
+    }
 
-    frame.render_widget(paragraph, inner_chunks[1]);
+    pub fn get(&self, index: usize) -> Option<&str> {
+        self.formatted
+            .get(index.checked_sub(self.start)?)
+            .map(String::as_str)
+    }
+}
+
+/// Rows for a single message: blank separator (except the first), header,
+/// then the body wrapped at `width` columns.
+fn message_lines<'a>(
+    index: usize,
+    msg: &'a Message,
+    ts: Cow<'a, str>,
+    width: usize,
+) -> impl Iterator<Item = Line<'a>> {
+    let role_color = match msg.role {
+        MessageRole::User => Color::Cyan,
+        MessageRole::Assistant => Color::Green,
+        MessageRole::System => Color::Yellow,
+        MessageRole::ToolUse => Color::Yellow,
+        MessageRole::ToolResult => Color::Magenta,
+        MessageRole::Progress => Color::DarkGray,
+    };
+
+    let mut header_spans = vec![Span::styled(
+        msg.role_label(),
+        Style::default()
+            .fg(role_color)
+            .add_modifier(Modifier::BOLD),
+    )];
+    if !ts.is_empty() {
+        header_spans.push(Span::raw(" "));
+        header_spans.push(Span::styled(ts, Style::default().fg(Color::DarkGray)));
+    }
+
+    let text_color = match msg.role {
+        MessageRole::ToolUse | MessageRole::ToolResult => Color::DarkGray,
+        _ => Color::White,
+    };
+
+    let separator = (index > 0).then(|| Line::from(""));
+    separator
+        .into_iter()
+        .chain(std::iter::once(Line::from(header_spans)))
+        .chain(
+            msg.text
+                .lines()
+                .flat_map(move |text_line| wrapped_rows(text_line, width))
+                .map(move |row| Line::from(Span::styled(row, Style::default().fg(text_color)))),
+        )
 }
 
 fn draw_global_search(frame: &mut Frame, app: &App, area: ratatui::layout::Rect) {